@@ -1,10 +1,15 @@
 """FastAPI REST API for Market Monitor & Productivity System."""
 
+import asyncio
 import os
+import time
+import orjson
+from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Optional
@@ -13,19 +18,35 @@ from datetime import datetime
 from config import get_settings
 from utils.logger import setup_logger, get_logger
 from database import get_db_manager
+from database.models import json_encoder
 from todos import TaskManager
 from reminders import ReminderManager
-from market_monitor import SummaryGenerator, MarketDataFetcher
+from market_monitor import SummaryGenerator, get_data_fetcher
 from scheduler import get_scheduler_service
 
 # Initialize
 settings = get_settings()
 logger = setup_logger('api', settings.app.log_file, settings.app.log_level)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """One-shot initialization at boot.
+
+    Data-directory creation and CREATE TABLE DDL run here, so they are
+    guaranteed off the critical path of the first user request.
+    """
+    get_db_manager()
+    yield
+
+
 app = FastAPI(
     title="Market Monitor API",
     description="REST API for Market Monitor & Productivity System",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes responses much faster than the stdlib json encoder
+    # and skips FastAPI's jsonable_encoder pass on plain dicts
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -40,10 +61,117 @@ app.add_middleware(
 # Initialize managers
 task_manager = TaskManager()
 reminder_manager = ReminderManager()
-market_fetcher = MarketDataFetcher()
+market_fetcher = get_data_fetcher()
 summary_generator = SummaryGenerator()
 
 
+class AsyncTTLCache:
+    """Small single-flight TTL cache for the market endpoints.
+
+    Market data is effectively constant within the TTL window, so concurrent
+    requests share one upstream fetch instead of each hitting Yahoo Finance.
+    A semaphore additionally bounds how many distinct keys may fetch
+    upstream at once, keeping outbound QPS flat regardless of inbound load.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_concurrent_fetches: int = 2):
+        self.ttl = ttl_seconds
+        self._entries = {}  # key -> (expires_at, value)
+        self._locks = {}  # key -> asyncio.Lock
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+
+    async def get_or_fetch(self, key, fetch):
+        """Return the cached value for key, or await fetch() once to fill it."""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check: another request may have refreshed while we waited
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            async with self._fetch_semaphore:
+                value = await fetch()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+
+market_cache = AsyncTTLCache(ttl_seconds=30.0)
+
+
+def _json_array_stream(key: str, fragments, chunk_size: int = 500):
+    """Yield a '{"<key>": [...]}' JSON document in chunks.
+
+    Streaming avoids building (and holding) the full response body in one
+    string, shrinking peak memory and time-to-first-byte on large lists.
+    """
+    yield f'{{"{key}":['
+    for start in range(0, len(fragments), chunk_size):
+        prefix = ',' if start else ''
+        yield prefix + ','.join(fragments[start:start + chunk_size])
+    yield ']}'
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with a stat cache and long-lived caching headers.
+
+    Starlette re-stats every file per request; the frontend bundle is
+    immutable between deploys, so stat results are cached after first
+    lookup and Vite's content-hashed assets get an immutable Cache-Control
+    header. index.html stays revalidated so new deploys are picked up.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stat_cache = {}
+
+    def lookup_path(self, path):
+        cached = self._stat_cache.get(path)
+        if cached is not None:
+            return cached
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            self._stat_cache[path] = (full_path, stat_result)
+        return full_path, stat_result
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if '/assets/' in str(full_path):
+            # Vite emits content-hashed filenames; safe to cache forever
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+
+def _make_list_serializer(key: str):
+    """Partial-evaluate a serializer for a '{"<key>": [...]}' payload.
+
+    The envelope bytes are computed once at startup; per request only the
+    row Structs are encoded (in C by msgspec) and appended to one buffer.
+    """
+    prefix = ('{"' + key + '":[').encode()
+    encode = json_encoder.encode
+
+    def serialize(rows) -> bytes:
+        buf = bytearray(prefix)
+        for i, row in enumerate(rows):
+            if i:
+                buf += b','
+            buf += encode(row._to_struct())
+        buf += b']}'
+        return bytes(buf)
+
+    return serialize
+
+
+serialize_task_list = _make_list_serializer('tasks')
+serialize_reminder_list = _make_list_serializer('reminders')
+
+
 # Pydantic models for API - MUST be defined before routes
 class TaskCreate(BaseModel):
     title: str
@@ -78,8 +206,8 @@ class ReminderUpdate(BaseModel):
 async def get_tasks(include_completed: bool = False):
     """Get all tasks."""
     try:
-        tasks = task_manager.get_all_tasks(include_completed=include_completed)
-        return {"tasks": [task.to_dict() for task in tasks]}
+        fragments = await run_in_threadpool(task_manager.get_all_tasks_json, include_completed=include_completed)
+        return StreamingResponse(_json_array_stream('tasks', fragments), media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching tasks: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -88,23 +216,24 @@ async def get_tasks(include_completed: bool = False):
 @app.get("/api/tasks/{task_id}")
 async def get_task(task_id: int):
     """Get a specific task."""
-    task = task_manager.get_task(task_id)
+    task = await run_in_threadpool(task_manager.get_task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task.to_dict()
+    return ORJSONResponse(task.to_dict())
 
 
 @app.post("/api/tasks")
 async def create_task(task: TaskCreate):
     """Create a new task."""
     try:
-        new_task = task_manager.create_task(
+        new_task = await run_in_threadpool(
+            task_manager.create_task,
             title=task.title,
             description=task.description,
             due_date=task.due_date,
             priority=task.priority
         )
-        return {"task": new_task.to_dict(), "message": "Task created successfully"}
+        return ORJSONResponse({"task": new_task.to_dict(), "message": "Task created successfully"})
     except Exception as e:
         logger.error(f"Error creating task: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -114,7 +243,8 @@ async def create_task(task: TaskCreate):
 async def update_task(task_id: int, task: TaskUpdate):
     """Update a task."""
     try:
-        updated = task_manager.update_task(
+        updated = await run_in_threadpool(
+            task_manager.update_task,
             task_id=task_id,
             title=task.title,
             description=task.description,
@@ -123,7 +253,7 @@ async def update_task(task_id: int, task: TaskUpdate):
         )
         if not updated:
             raise HTTPException(status_code=404, detail="Task not found")
-        return {"task": updated.to_dict(), "message": "Task updated successfully"}
+        return ORJSONResponse({"task": updated.to_dict(), "message": "Task updated successfully"})
     except HTTPException:
         raise
     except Exception as e:
@@ -134,42 +264,42 @@ async def update_task(task_id: int, task: TaskUpdate):
 @app.post("/api/tasks/{task_id}/complete")
 async def complete_task(task_id: int):
     """Mark task as complete."""
-    success = task_manager.complete_task(task_id)
+    success = await run_in_threadpool(task_manager.complete_task, task_id)
     if not success:
         raise HTTPException(status_code=404, detail="Task not found")
-    return {"message": "Task completed successfully"}
+    return ORJSONResponse({"message": "Task completed successfully"})
 
 
 @app.post("/api/tasks/{task_id}/uncomplete")
 async def uncomplete_task(task_id: int):
     """Mark task as incomplete."""
-    success = task_manager.uncomplete_task(task_id)
+    success = await run_in_threadpool(task_manager.uncomplete_task, task_id)
     if not success:
         raise HTTPException(status_code=404, detail="Task not found")
-    return {"message": "Task marked as incomplete"}
+    return ORJSONResponse({"message": "Task marked as incomplete"})
 
 
 @app.delete("/api/tasks/{task_id}")
 async def delete_task(task_id: int):
     """Delete a task."""
-    success = task_manager.delete_task(task_id)
+    success = await run_in_threadpool(task_manager.delete_task, task_id)
     if not success:
         raise HTTPException(status_code=404, detail="Task not found")
-    return {"message": "Task deleted successfully"}
+    return ORJSONResponse({"message": "Task deleted successfully"})
 
 
 @app.get("/api/tasks/filter/today")
 async def get_today_tasks():
     """Get tasks due today."""
-    tasks = task_manager.get_today_tasks()
-    return {"tasks": [task.to_dict() for task in tasks]}
+    tasks = await run_in_threadpool(task_manager.get_today_tasks)
+    return Response(content=serialize_task_list(tasks), media_type="application/json")
 
 
 @app.get("/api/tasks/filter/overdue")
 async def get_overdue_tasks():
     """Get overdue tasks."""
-    tasks = task_manager.get_overdue_tasks()
-    return {"tasks": [task.to_dict() for task in tasks]}
+    tasks = await run_in_threadpool(task_manager.get_overdue_tasks)
+    return Response(content=serialize_task_list(tasks), media_type="application/json")
 
 
 # Reminder endpoints
@@ -177,8 +307,8 @@ async def get_overdue_tasks():
 async def get_reminders(active_only: bool = True):
     """Get all reminders."""
     try:
-        reminders = reminder_manager.get_all_reminders(active_only=active_only)
-        return {"reminders": [r.to_dict() for r in reminders]}
+        fragments = await run_in_threadpool(reminder_manager.get_all_reminders_json, active_only=active_only)
+        return StreamingResponse(_json_array_stream('reminders', fragments), media_type="application/json")
     except Exception as e:
         logger.error(f"Error fetching reminders: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -187,23 +317,24 @@ async def get_reminders(active_only: bool = True):
 @app.get("/api/reminders/{reminder_id}")
 async def get_reminder(reminder_id: int):
     """Get a specific reminder."""
-    reminder = reminder_manager.get_reminder(reminder_id)
+    reminder = await run_in_threadpool(reminder_manager.get_reminder, reminder_id)
     if not reminder:
         raise HTTPException(status_code=404, detail="Reminder not found")
-    return reminder.to_dict()
+    return ORJSONResponse(reminder.to_dict())
 
 
 @app.post("/api/reminders")
 async def create_reminder(reminder: ReminderCreate):
     """Create a new reminder."""
     try:
-        new_reminder = reminder_manager.create_reminder(
+        new_reminder = await run_in_threadpool(
+            reminder_manager.create_reminder,
             title=reminder.title,
             datetime_str=reminder.datetime,
             description=reminder.description,
             recurring_type=reminder.recurring_type
         )
-        return {"reminder": new_reminder.to_dict(), "message": "Reminder created successfully"}
+        return ORJSONResponse({"reminder": new_reminder.to_dict(), "message": "Reminder created successfully"})
     except Exception as e:
         logger.error(f"Error creating reminder: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -213,7 +344,8 @@ async def create_reminder(reminder: ReminderCreate):
 async def update_reminder(reminder_id: int, reminder: ReminderUpdate):
     """Update a reminder."""
     try:
-        updated = reminder_manager.update_reminder(
+        updated = await run_in_threadpool(
+            reminder_manager.update_reminder,
             reminder_id=reminder_id,
             title=reminder.title,
             datetime_str=reminder.datetime,
@@ -222,7 +354,7 @@ async def update_reminder(reminder_id: int, reminder: ReminderUpdate):
         )
         if not updated:
             raise HTTPException(status_code=404, detail="Reminder not found")
-        return {"reminder": updated.to_dict(), "message": "Reminder updated successfully"}
+        return ORJSONResponse({"reminder": updated.to_dict(), "message": "Reminder updated successfully"})
     except HTTPException:
         raise
     except Exception as e:
@@ -233,10 +365,10 @@ async def update_reminder(reminder_id: int, reminder: ReminderUpdate):
 @app.delete("/api/reminders/{reminder_id}")
 async def delete_reminder(reminder_id: int):
     """Delete a reminder."""
-    success = reminder_manager.delete_reminder(reminder_id)
+    success = await run_in_threadpool(reminder_manager.delete_reminder, reminder_id)
     if not success:
         raise HTTPException(status_code=404, detail="Reminder not found")
-    return {"message": "Reminder deleted successfully"}
+    return ORJSONResponse({"message": "Reminder deleted successfully"})
 
 
 # Market data endpoints
@@ -244,9 +376,13 @@ async def delete_reminder(reminder_id: int):
 async def get_market_summary():
     """Get current market summary."""
     try:
-        summary = summary_generator.generate_daily_summary(
-            indices=settings.market.indices,
-            include_sectors=True
+        summary = await market_cache.get_or_fetch(
+            'summary',
+            lambda: run_in_threadpool(
+                summary_generator.generate_daily_summary,
+                indices=settings.market.indices,
+                include_sectors=True
+            )
         )
         
         # If summary indicates failure, use demo data
@@ -255,13 +391,13 @@ async def get_market_summary():
             from market_monitor.demo_data import get_demo_summary
             summary = get_demo_summary()
         
-        return {"summary": summary}
+        return ORJSONResponse({"summary": summary})
     except Exception as e:
         logger.error(f"Error generating market summary: {e}")
         # Return demo summary on error
         try:
             from market_monitor.demo_data import get_demo_summary
-            return {"summary": get_demo_summary()}
+            return ORJSONResponse({"summary": get_demo_summary()})
         except:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -270,7 +406,10 @@ async def get_market_summary():
 async def get_market_indices():
     """Get current market index data."""
     try:
-        indices_data = market_fetcher.fetch_multiple_indices(settings.market.indices)
+        indices_data = await market_cache.get_or_fetch(
+            'indices',
+            lambda: run_in_threadpool(market_fetcher.fetch_multiple_indices, settings.market.indices)
+        )
         
         # If no data was fetched (API failures, rate limits, etc.), use demo data
         if not indices_data:
@@ -278,13 +417,18 @@ async def get_market_indices():
             from market_monitor.demo_data import get_demo_indices
             indices_data = get_demo_indices()
         
-        return {"indices": indices_data}
+        # OPT_SERIALIZE_NUMPY lets the fetcher's float64 scalars pass
+        # straight through without Python-level boxing
+        return Response(
+            content=orjson.dumps({"indices": indices_data}, option=orjson.OPT_SERIALIZE_NUMPY),
+            media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Error fetching market indices: {e}")
         # Return demo data on error
         try:
             from market_monitor.demo_data import get_demo_indices
-            return {"indices": get_demo_indices()}
+            return ORJSONResponse({"indices": get_demo_indices()})
         except:
             raise HTTPException(status_code=500, detail=str(e))
 
@@ -293,8 +437,11 @@ async def get_market_indices():
 async def get_sector_performance():
     """Get sector performance data."""
     try:
-        sectors = market_fetcher.get_sector_performance()
-        return {"sectors": sectors}
+        sectors = await market_cache.get_or_fetch(
+            'sectors',
+            lambda: run_in_threadpool(market_fetcher.get_sector_performance)
+        )
+        return ORJSONResponse({"sectors": sectors})
     except Exception as e:
         logger.error(f"Error fetching sector performance: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -308,7 +455,7 @@ async def get_system_status():
         scheduler = get_scheduler_service()
         jobs = scheduler.get_jobs() if scheduler.scheduler else []
         
-        return {
+        return ORJSONResponse({
             "status": "running",
             "scheduler_active": scheduler.scheduler is not None,
             "jobs": [
@@ -319,7 +466,7 @@ async def get_system_status():
                 }
                 for job in jobs
             ]
-        }
+        })
     except Exception as e:
         logger.error(f"Error fetching system status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -329,22 +476,19 @@ async def get_system_status():
 async def get_dashboard_stats():
     """Get dashboard statistics."""
     try:
-        all_tasks = task_manager.get_all_tasks(include_completed=False)
-        today_tasks = task_manager.get_today_tasks()
-        overdue_tasks = task_manager.get_overdue_tasks()
-        active_reminders = reminder_manager.get_all_reminders(active_only=True)
-        
-        return {
-            "tasks": {
-                "total": len(all_tasks),
-                "today": len(today_tasks),
-                "overdue": len(overdue_tasks),
-                "high_priority": len([t for t in all_tasks if t.priority == "high"])
-            },
+        # Both counts are independent; run them concurrently instead of
+        # paying two sequential round trips
+        task_stats, active_reminders = await asyncio.gather(
+            run_in_threadpool(task_manager.get_task_stats),
+            run_in_threadpool(reminder_manager.count_reminders, active_only=True)
+        )
+
+        return ORJSONResponse({
+            "tasks": task_stats,
             "reminders": {
-                "active": len(active_reminders)
+                "active": active_reminders
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error fetching dashboard stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -354,7 +498,7 @@ async def get_dashboard_stats():
 static_dir = Path(__file__).parent.parent / "static"
 if static_dir.exists() and static_dir.is_dir():
     logger.info(f"Serving static files from {static_dir}")
-    app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+    app.mount("/", CachedStaticFiles(directory=str(static_dir), html=True), name="static")
 else:
     logger.warning(f"Static directory not found at {static_dir}, frontend will not be served")
     
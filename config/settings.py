@@ -1,11 +1,16 @@
 """Configuration management using Pydantic."""
 
+from functools import lru_cache
 from typing import List, Dict, Any
 from pathlib import Path
 from pydantic import Field
 from pydantic_settings import BaseSettings
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built with it; it parses
+# several times faster than the pure-Python tokenizer
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class AppSettings(BaseSettings):
     """Application settings."""
@@ -59,6 +64,12 @@ class EmailNotificationSettings(BaseSettings):
     sender_email: str = ""
     sender_password: str = ""
     recipient_email: str = ""
+    # Recycle the pooled SMTP connection after this many messages so
+    # provider per-connection caps are never hit mid-burst
+    max_msgs_per_connection: int = 1000
+    # Send multipart plain+HTML bodies; disable for plain-text-only
+    # messages at roughly half the DATA bytes
+    html: bool = True
 
     class Config:
         env_prefix = "EMAIL_"
@@ -104,6 +115,9 @@ class SchedulerJobDefaults(BaseSettings):
 class SchedulerSettings(BaseSettings):
     """Scheduler configuration."""
     timezone: str = "Asia/Kolkata"
+    # Worker threads for job execution; jobs are I/O-bound, so a few
+    # threads let overlapping jobs run without blocking each other
+    max_workers: int = 10
     job_defaults: SchedulerJobDefaults = Field(default_factory=SchedulerJobDefaults)
 
 
@@ -125,22 +139,16 @@ class Settings(BaseSettings):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YAML_LOADER)
         
         return cls(**config_data)
 
 
-# Global settings instance
-settings: Settings = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create settings instance."""
-    global settings
-    if settings is None:
-        try:
-            settings = Settings.load_from_yaml()
-        except FileNotFoundError:
-            # Use default settings if config file doesn't exist
-            settings = Settings()
-    return settings
+    """Get or create settings instance (cached and thread-safe)."""
+    try:
+        return Settings.load_from_yaml()
+    except FileNotFoundError:
+        # Use default settings if config file doesn't exist
+        return Settings()
@@ -3,8 +3,9 @@
 from pathlib import Path
 from typing import Optional, List, Type, TypeVar
 from contextlib import contextmanager
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from database.models import Base, Reminder, Task, MarketSnapshot
 from utils.logger import get_logger
 
@@ -29,16 +30,76 @@ class DatabaseManager:
         if database_url.startswith('sqlite:///'):
             db_path = Path(database_url.replace('sqlite:///', ''))
             db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        self.engine = create_engine(database_url, echo=False)
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+
+        if database_url.startswith('sqlite') and ':memory:' in database_url:
+            # In-memory SQLite lives and dies with its connection, so all
+            # sessions must share the one connection StaticPool pins
+            self.engine = create_engine(
+                database_url,
+                echo=False,
+                connect_args={'check_same_thread': False},
+                poolclass=StaticPool
+            )
+        elif database_url.startswith('sqlite'):
+            # File-backed SQLite: the default pool gives each checkout its
+            # own connection, so concurrent sessions (API threadpool,
+            # scheduler jobs) can't interleave transactions on a shared
+            # sqlite3 handle; check_same_thread off because the pool hands
+            # connections across threads
+            self.engine = create_engine(
+                database_url,
+                echo=False,
+                connect_args={'check_same_thread': False}
+            )
+        else:
+            # Server databases: explicit pool sizing so concurrent sessions
+            # don't queue on a single connection, and pre-ping to drop dead
+            # connections before they fail mid-request
+            self.engine = create_engine(
+                database_url,
+                echo=False,
+                pool_size=20,
+                max_overflow=10,
+                pool_timeout=30,
+                pool_pre_ping=True
+            )
+        # expire_on_commit=False keeps returned objects readable after the
+        # session closes instead of raising DetachedInstanceError
+        self.SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self.engine
+        )
         
         logger.info(f"Database initialized: {database_url}")
     
     def create_tables(self):
         """Create all tables in the database."""
         Base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns()
         logger.info("Database tables created")
+
+    def _add_missing_columns(self):
+        """
+        Add columns that exist on the models but not in the database.
+
+        create_all() only creates missing tables, so databases created by
+        an older version of the code would otherwise break when a model
+        gains a column. Covers simple nullable additions (no migrations
+        framework in this project).
+        """
+        inspector = inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {col['name'] for col in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing and column.nullable:
+                        col_type = column.type.compile(dialect=self.engine.dialect)
+                        conn.execute(text(
+                            f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}'
+                        ))
+                        logger.info(f"Added missing column {table.name}.{column.name}")
     
     def drop_tables(self):
         """Drop all tables in the database."""
@@ -76,8 +137,9 @@ class DatabaseManager:
         """
         with self.get_session() as session:
             session.add(obj)
+            # flush() populates the PK and Python-side defaults; no refresh
+            # (extra SELECT) needed since there are no server-side defaults
             session.flush()
-            session.refresh(obj)
             # Expunge to avoid detached instance errors
             session.expunge(obj)
             return obj
@@ -94,7 +156,9 @@ class DatabaseManager:
             Model instance or None
         """
         with self.get_session() as session:
-            return session.query(model).filter(model.id == obj_id).first()
+            # session.get() checks the identity map and emits a cached
+            # PK SELECT, skipping legacy Query compilation
+            return session.get(model, obj_id)
     
     def get_all(self, model: Type[T]) -> List[T]:
         """
@@ -144,7 +208,7 @@ class DatabaseManager:
             obj_id: Object ID
         """
         with self.get_session() as session:
-            obj = session.query(model).filter(model.id == obj_id).first()
+            obj = session.get(model, obj_id)
             if obj:
                 session.delete(obj)
                 session.flush()
@@ -2,18 +2,65 @@
 
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text
+import msgspec
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Float, Boolean, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.attributes import set_committed_value
 
 Base = declarative_base()
 
+# Shared JSON encoder for the Struct mirrors below. Created once at module
+# scope so the schema build cost is paid a single time per process.
+json_encoder = msgspec.json.Encoder()
+
+
+class ReminderOut(msgspec.Struct):
+    """Serialization mirror of Reminder for hot read paths."""
+    id: int
+    title: str
+    description: Optional[str]
+    datetime: Optional[datetime]
+    recurring_type: Optional[str]
+    is_active: bool
+    created_at: Optional[datetime]
+
+
+class TaskOut(msgspec.Struct):
+    """Serialization mirror of Task for hot read paths."""
+    id: int
+    title: str
+    description: Optional[str]
+    due_date: Optional[datetime]
+    priority: str
+    is_completed: bool
+    created_at: Optional[datetime]
+    completed_at: Optional[datetime]
+
+
+class MarketSnapshotOut(msgspec.Struct):
+    """Serialization mirror of MarketSnapshot for hot read paths."""
+    id: int
+    index_name: str
+    index_symbol: str
+    value: float
+    change: Optional[float]
+    change_percent: Optional[float]
+    timestamp: Optional[datetime]
+
 
 class Reminder(Base):
     """Reminder model for storing user reminders."""
     
     __tablename__ = 'reminders'
-    
+    __table_args__ = (
+        # Backs get_all_reminders and the due-reminder queries: equality
+        # on is_active, range + order on datetime, and last_notified
+        # included so the recently-notified predicate is answered from
+        # the index without touching the row
+        Index('ix_reminder_active_dt', 'is_active', 'datetime', 'last_notified'),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
@@ -22,20 +69,37 @@ class Reminder(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     last_notified = Column(DateTime, nullable=True)
+    cached_json = Column(Text, nullable=True)  # pre-serialized Struct, kept fresh on write
     
     def __repr__(self):
         return f"<Reminder(id={self.id}, title='{self.title}', datetime={self.datetime})>"
-    
+
+    def _to_struct(self) -> ReminderOut:
+        """Convert model to its msgspec Struct mirror (cheap to encode)."""
+        return ReminderOut(
+            id=self.id,
+            title=self.title,
+            description=self.description,
+            datetime=self.datetime,
+            recurring_type=self.recurring_type,
+            is_active=self.is_active,
+            created_at=self.created_at
+        )
+
     def to_dict(self):
-        """Convert model to dictionary."""
+        """Convert model to dictionary.
+
+        Datetime fields are returned as-is; orjson serializes them to ISO
+        8601 natively, which is much cheaper than Python-level isoformat().
+        """
         return {
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'datetime': self.datetime.isoformat() if self.datetime else None,
+            'datetime': self.datetime,
             'recurring_type': self.recurring_type,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at
         }
 
 
@@ -43,7 +107,13 @@ class Task(Base):
     """Task model for to-do list items."""
     
     __tablename__ = 'tasks'
-    
+    __table_args__ = (
+        # Backs the pending-task queries: equality on is_completed,
+        # range on due_date, with priority included so the default
+        # (due_date, priority) ordering is answered from the index
+        Index('ix_task_incomplete_due', 'is_completed', 'due_date', 'priority'),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
@@ -52,22 +122,40 @@ class Task(Base):
     is_completed = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     completed_at = Column(DateTime, nullable=True)
+    cached_json = Column(Text, nullable=True)  # pre-serialized Struct, kept fresh on write
     
     def __repr__(self):
         status = "✓" if self.is_completed else "○"
         return f"<Task({status} {self.id}: '{self.title}' - {self.priority})>"
-    
+
+    def _to_struct(self) -> TaskOut:
+        """Convert model to its msgspec Struct mirror (cheap to encode)."""
+        return TaskOut(
+            id=self.id,
+            title=self.title,
+            description=self.description,
+            due_date=self.due_date,
+            priority=self.priority,
+            is_completed=self.is_completed,
+            created_at=self.created_at,
+            completed_at=self.completed_at
+        )
+
     def to_dict(self):
-        """Convert model to dictionary."""
+        """Convert model to dictionary.
+
+        Datetime fields are returned as-is; orjson serializes them to ISO
+        8601 natively, which is much cheaper than Python-level isoformat().
+        """
         return {
             'id': self.id,
             'title': self.title,
             'description': self.description,
-            'due_date': self.due_date.isoformat() if self.due_date else None,
+            'due_date': self.due_date,
             'priority': self.priority,
             'is_completed': self.is_completed,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+            'created_at': self.created_at,
+            'completed_at': self.completed_at
         }
 
 
@@ -75,7 +163,11 @@ class MarketSnapshot(Base):
     """Market snapshot model for historical tracking."""
     
     __tablename__ = 'market_snapshots'
-    
+    __table_args__ = (
+        # Per-symbol history lookups stay index range scans as the table grows
+        Index('ix_ms_symbol_ts', 'index_symbol', 'timestamp'),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     index_name = Column(String(50), nullable=False)
     index_symbol = Column(String(50), nullable=False)
@@ -83,12 +175,29 @@ class MarketSnapshot(Base):
     change = Column(Float, nullable=True)
     change_percent = Column(Float, nullable=True)
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    cached_json = Column(Text, nullable=True)  # pre-serialized Struct, kept fresh on write
     
     def __repr__(self):
         return f"<MarketSnapshot({self.index_name}: {self.value} at {self.timestamp})>"
-    
+
+    def _to_struct(self) -> MarketSnapshotOut:
+        """Convert model to its msgspec Struct mirror (cheap to encode)."""
+        return MarketSnapshotOut(
+            id=self.id,
+            index_name=self.index_name,
+            index_symbol=self.index_symbol,
+            value=self.value,
+            change=self.change,
+            change_percent=self.change_percent,
+            timestamp=self.timestamp
+        )
+
     def to_dict(self):
-        """Convert model to dictionary."""
+        """Convert model to dictionary.
+
+        Datetime fields are returned as-is; orjson serializes them to ISO
+        8601 natively, which is much cheaper than Python-level isoformat().
+        """
         return {
             'id': self.id,
             'index_name': self.index_name,
@@ -96,5 +205,28 @@ class MarketSnapshot(Base):
             'value': self.value,
             'change': self.change,
             'change_percent': self.change_percent,
-            'timestamp': self.timestamp.isoformat() if self.timestamp else None
+            'timestamp': self.timestamp
         }
+
+
+# Keep cached_json in sync at write time so read paths can return raw JSON
+# fragments without re-serializing every row on every request.
+
+def _refresh_cached_json(mapper, connection, target):
+    target.cached_json = json_encoder.encode(target._to_struct()).decode()
+
+
+def _cache_json_after_insert(mapper, connection, target):
+    # The autoincrement id only exists after the INSERT, so the blob is
+    # written in a follow-up UPDATE on the same connection.
+    blob = json_encoder.encode(target._to_struct()).decode()
+    set_committed_value(target, 'cached_json', blob)
+    table = mapper.local_table
+    connection.execute(
+        table.update().where(table.c.id == target.id).values(cached_json=blob)
+    )
+
+
+for _model in (Reminder, Task, MarketSnapshot):
+    event.listen(_model, 'after_insert', _cache_json_after_insert)
+    event.listen(_model, 'before_update', _refresh_cached_json)
@@ -2,7 +2,7 @@
 
 import sys
 import signal
-import time
+import threading
 from pathlib import Path
 import click
 from config import get_settings
@@ -13,12 +13,18 @@ from scheduler import get_scheduler_service
 # Setup logger
 logger = None
 
+# Set by signal_handler; the daemon loop blocks on it instead of polling
+shutdown_event = threading.Event()
+
 
 def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
-    logger.info(f"Received signal {signum}, shutting down...")
-    shutdown()
-    sys.exit(0)
+    """Handle shutdown signals gracefully.
+
+    Only flips the event — a single atomic operation. Logging and the
+    actual teardown run in the main thread once the daemon wakes up, so
+    nothing reentrant happens in signal context.
+    """
+    shutdown_event.set()
 
 
 def shutdown():
@@ -97,9 +103,10 @@ def daemon(test):
     logger.info("Application running. Press Ctrl+C to stop.")
     
     try:
-        # Keep the application running
-        while True:
-            time.sleep(1)
+        # Block until a shutdown signal arrives — the kernel parks the
+        # thread, so the process is truly idle between scheduler fires
+        shutdown_event.wait()
+        logger.info("Received shutdown signal, shutting down...")
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     finally:
@@ -112,9 +119,9 @@ def status():
     settings = initialize()
     
     scheduler_service = get_scheduler_service()
-    scheduler_service.start()
-    
-    jobs = scheduler_service.get_jobs()
+    # Read-only: list the registered jobs without spinning up the
+    # scheduler's worker threads
+    jobs = scheduler_service.get_jobs_dry()
     
     click.echo("\n📊 Scheduled Jobs Status\n" + "=" * 60)
     
@@ -128,8 +135,6 @@ def status():
             click.echo(f"   Trigger: {job.trigger}")
     
     click.echo("\n" + "=" * 60 + "\n")
-    
-    scheduler_service.stop()
 
 
 @cli.command()
@@ -139,14 +144,17 @@ def run_job(job_id):
     settings = initialize()
     
     scheduler_service = get_scheduler_service()
-    scheduler_service.start()
     
     click.echo(f"Running job: {job_id}")
-    success = scheduler_service.run_job_now(job_id)
-    
-    if success:
-        click.echo(f"✓ Job {job_id} triggered successfully")
-        time.sleep(2)  # Wait for job to complete
+    future = scheduler_service.run_job_now(job_id)
+    
+    if future is not None:
+        try:
+            # Wait for actual completion instead of sleeping a guess
+            future.result(timeout=30)
+            click.echo(f"✓ Job {job_id} completed successfully")
+        except Exception as e:
+            click.echo(f"✗ Job {job_id} failed: {e}")
     else:
         click.echo(f"✗ Failed to trigger job {job_id}")
     
@@ -156,13 +164,12 @@ def run_job(job_id):
 @cli.command()
 def market_summary():
     """Generate and display market summary."""
-    initialize()
-    
+    settings = initialize()
+
     from market_monitor import SummaryGenerator
-    
+
     generator = SummaryGenerator()
-    settings = get_settings()
-    
+
     summary = generator.generate_daily_summary(
         indices=settings.market.indices,
         include_sectors=True
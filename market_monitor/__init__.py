@@ -1,11 +1,12 @@
 """Market monitoring module for Indian stock indices."""
 
-from market_monitor.data_fetcher import MarketDataFetcher
+from market_monitor.data_fetcher import MarketDataFetcher, get_data_fetcher
 from market_monitor.analyzer import MarketAnalyzer
 from market_monitor.summary_generator import SummaryGenerator
 
 __all__ = [
     'MarketDataFetcher',
+    'get_data_fetcher',
     'MarketAnalyzer',
     'SummaryGenerator'
 ]
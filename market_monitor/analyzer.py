@@ -1,12 +1,30 @@
 """Market trend analyzer."""
 
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
 from utils.logger import get_logger
 from utils.helpers import format_percentage
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class AnalysisResult:
+    """One-pass analysis over a batch of index data.
+
+    Computed once by MarketAnalyzer.compute_once so the summary and the
+    live update can share sentiment/trends without re-scanning the data.
+    """
+    pcts: np.ndarray
+    types: np.ndarray
+    mean: float
+    sentiment: str
+    trends: Dict
+    significant_moves: List[Dict]
+
+
 class MarketAnalyzer:
     """Analyze market trends and generate insights."""
     
@@ -14,22 +32,60 @@ class MarketAnalyzer:
         """Initialize market analyzer."""
         pass
     
-    def determine_sentiment(self, indices_data: List[Dict]) -> str:
+    @staticmethod
+    def _to_arrays(indices_data: Union[List[Dict], pd.DataFrame]):
+        """
+        Extract change percents and index types into NumPy arrays.
+
+        Built once per analysis and passed down so each method works on
+        arrays instead of re-walking the rows. DataFrames hand over their
+        columns directly; lists of dicts are walked a single time.
+
+        Args:
+            indices_data: Index data as a list of dicts or a DataFrame
+
+        Returns:
+            Tuple of (change percent array, index type array)
+        """
+        if isinstance(indices_data, pd.DataFrame):
+            pcts = indices_data['change_percent'].to_numpy(dtype=np.float64)
+            if 'type' in indices_data.columns:
+                types = indices_data['type'].to_numpy(dtype=object)
+            else:
+                types = np.full(len(indices_data), 'unknown', dtype=object)
+            return pcts, types
+        pcts = np.array(
+            [data.get('change_percent', 0) for data in indices_data],
+            dtype=np.float64
+        )
+        types = np.array(
+            [data.get('type', 'unknown') for data in indices_data],
+            dtype=object
+        )
+        return pcts, types
+
+    def determine_sentiment(
+        self,
+        indices_data: Union[List[Dict], pd.DataFrame],
+        pcts: Optional[np.ndarray] = None
+    ) -> str:
         """
         Determine overall market sentiment based on index performance.
         
         Args:
             indices_data: List of index data dictionaries
+            pcts: Optional precomputed change percent array
         
         Returns:
             Sentiment string: 'bullish', 'bearish', or 'neutral'
         """
-        if not indices_data:
+        if len(indices_data) == 0:
             return 'neutral'
         
         # Calculate average change percent
-        total_change = sum(data.get('change_percent', 0) for data in indices_data)
-        avg_change = total_change / len(indices_data)
+        if pcts is None:
+            pcts, _ = self._to_arrays(indices_data)
+        avg_change = pcts.mean()
         
         # Determine sentiment
         if avg_change > 0.5:
@@ -39,12 +95,19 @@ class MarketAnalyzer:
         else:
             return 'neutral'
     
-    def analyze_trends(self, indices_data: List[Dict]) -> Dict:
+    def analyze_trends(
+        self,
+        indices_data: Union[List[Dict], pd.DataFrame],
+        pcts: Optional[np.ndarray] = None,
+        types: Optional[np.ndarray] = None
+    ) -> Dict:
         """
         Analyze market trends across different market caps.
         
         Args:
             indices_data: List of index data with 'type' field
+            pcts: Optional precomputed change percent array
+            types: Optional precomputed index type array
         
         Returns:
             Dictionary with trend analysis
@@ -56,19 +119,16 @@ class MarketAnalyzer:
             'overall_sentiment': 'neutral'
         }
         
-        # Group by type
-        for data in indices_data:
-            index_type = data.get('type', 'unknown')
-            change = data.get('change_percent', 0)
-            
-            if index_type in analysis:
-                analysis[index_type]['count'] += 1
-                analysis[index_type]['avg_change'] += change
+        if pcts is None or types is None:
+            pcts, types = self._to_arrays(indices_data)
         
-        # Calculate averages and trends
+        # Group averages via boolean masks over the shared arrays
         for cap_type in ['large_cap', 'mid_cap', 'small_cap']:
-            if analysis[cap_type]['count'] > 0:
-                avg = analysis[cap_type]['avg_change'] / analysis[cap_type]['count']
+            mask = types == cap_type
+            count = int(mask.sum())
+            if count > 0:
+                avg = float(pcts[mask].mean())
+                analysis[cap_type]['count'] = count
                 analysis[cap_type]['avg_change'] = round(avg, 2)
                 
                 # Determine trend
@@ -80,55 +140,106 @@ class MarketAnalyzer:
                     analysis[cap_type]['trend'] = 'flat'
         
         # Overall sentiment
-        analysis['overall_sentiment'] = self.determine_sentiment(indices_data)
+        analysis['overall_sentiment'] = self.determine_sentiment(indices_data, pcts)
         
         return analysis
     
-    def detect_significant_moves(self, indices_data: List[Dict], threshold: float = 2.0) -> List[Dict]:
+    def detect_significant_moves(
+        self,
+        indices_data: Union[List[Dict], pd.DataFrame],
+        threshold: float = 2.0,
+        pcts: Optional[np.ndarray] = None
+    ) -> List[Dict]:
         """
         Detect indices with significant price movements.
         
         Args:
             indices_data: List of index data
             threshold: Change percentage threshold for significance
+            pcts: Optional precomputed change percent array
         
         Returns:
             List of indices with significant moves
         """
+        if pcts is None:
+            pcts, _ = self._to_arrays(indices_data)
+        
         significant_moves = []
         
-        for data in indices_data:
-            change_pct = abs(data.get('change_percent', 0))
-            if change_pct >= threshold:
-                significant_moves.append({
-                    'name': data.get('name'),
-                    'change_percent': data.get('change_percent'),
-                    'current_price': data.get('current_price'),
-                    'direction': 'up' if data.get('change_percent', 0) > 0 else 'down'
-                })
+        # Single vectorized compare; only matches are materialized as rows
+        matches = np.flatnonzero(np.abs(pcts) >= threshold)
+        if isinstance(indices_data, pd.DataFrame):
+            indices_data = indices_data.iloc[matches].to_dict('records')
+            matches = range(len(indices_data))
+        for i in matches:
+            data = indices_data[i]
+            significant_moves.append({
+                'name': data.get('name'),
+                'change_percent': data.get('change_percent'),
+                'current_price': data.get('current_price'),
+                'direction': 'up' if data.get('change_percent', 0) > 0 else 'down'
+            })
         
         return significant_moves
     
-    def generate_insights(self, indices_data: List[Dict], sector_data: List[Dict] = None) -> List[str]:
+    def compute_once(
+        self,
+        indices_data: Union[List[Dict], pd.DataFrame],
+        threshold: float = 1.5
+    ) -> AnalysisResult:
+        """
+        Run the full analysis over the data in a single pass.
+        
+        Args:
+            indices_data: Index data as a list of dicts or a DataFrame
+            threshold: Change percentage threshold for significant moves
+        
+        Returns:
+            AnalysisResult holding the shared arrays and derived values
+        """
+        pcts, types = self._to_arrays(indices_data)
+        trends = self.analyze_trends(indices_data, pcts, types)
+        return AnalysisResult(
+            pcts=pcts,
+            types=types,
+            mean=float(pcts.mean()) if len(pcts) else 0.0,
+            sentiment=trends['overall_sentiment'],
+            trends=trends,
+            significant_moves=self.detect_significant_moves(
+                indices_data, threshold=threshold, pcts=pcts
+            )
+        )
+    
+    def generate_insights(
+        self,
+        indices_data: Union[List[Dict], pd.DataFrame],
+        sector_data: List[Dict] = None,
+        analysis: Optional[AnalysisResult] = None
+    ) -> List[str]:
         """
         Generate human-readable market insights.
         
         Args:
             indices_data: List of index data
             sector_data: Optional sector performance data
+            analysis: Optional precomputed AnalysisResult to reuse
         
         Returns:
             List of insight strings
         """
         insights = []
         
+        # Analyze once; every step below reuses the result
+        if analysis is None:
+            analysis = self.compute_once(indices_data)
+        
         # Overall sentiment
-        sentiment = self.determine_sentiment(indices_data)
+        sentiment = analysis.sentiment
         sentiment_emoji = {'bullish': '📈', 'bearish': '📉', 'neutral': '➡️'}
         insights.append(f"{sentiment_emoji[sentiment]} Market Sentiment: {sentiment.upper()}")
         
         # Trend analysis
-        trends = self.analyze_trends(indices_data)
+        trends = analysis.trends
         
         # Large cap trend
         large_cap = trends['large_cap']
@@ -156,7 +267,7 @@ class MarketAnalyzer:
             )
         
         # Significant moves
-        sig_moves = self.detect_significant_moves(indices_data, threshold=1.5)
+        sig_moves = analysis.significant_moves
         if sig_moves:
             insights.append("⚠️ Significant moves detected:")
             for move in sig_moves:
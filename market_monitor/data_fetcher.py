@@ -1,22 +1,137 @@
 """Market data fetcher for Indian stock indices."""
 
-from typing import Dict, List, Optional
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+import requests
 import yfinance as yf
 from utils.logger import get_logger
-from utils.helpers import get_ist_now, calculate_change_percent
+from market_monitor.numeric import change_stats
 
 logger = get_logger(__name__)
 
+# Sector indices as (display name, Yahoo symbol) pairs; a tuple constant
+# so consumers iterate or slice it without building a dict per call
+SECTOR_INDICES: Tuple[Tuple[str, str], ...] = (
+    ('NIFTY BANK', '^NSEBANK'),
+    ('NIFTY IT', '^CNXIT'),
+    ('NIFTY AUTO', '^CNXAUTO'),
+    ('NIFTY PHARMA', '^CNXPHARMA'),
+    ('NIFTY FMCG', '^CNXFMCG')
+)
+
 
 class MarketDataFetcher:
     """Fetch market data from Yahoo Finance."""
     
+    # Hard cap on cached entries so a long-running daemon that scans new
+    # symbols over time cannot grow the cache without bound
+    CACHE_MAXSIZE = 512
+
     def __init__(self):
         """Initialize market data fetcher."""
-        self.cache = {}
+        # Ordered so the least-recently-used entry is always first;
+        # the lock keeps LRU bookkeeping consistent across fetch threads
+        self.cache = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.cache_expiry = timedelta(minutes=5)
+        # Freshness is tracked with the monotonic clock: a float compare
+        # per lookup instead of a timezone-aware datetime subtraction
+        self._cache_ttl = self.cache_expiry.total_seconds()
+        # One keep-alive session shared by all ticker fetches so TCP/TLS
+        # setup is amortized across symbols instead of paid per call
+        self.session = requests.Session()
+        # Still-fresh entries persisted by a previous process let repeated
+        # CLI runs inside the TTL window skip the network entirely
+        self._cache_path = Path('data/market_cache.pkl')
+        self._load_disk_cache()
+
+    def _load_disk_cache(self):
+        """Load still-fresh cache entries persisted by a previous run."""
+        try:
+            if not self._cache_path.exists():
+                return
+            with open(self._cache_path, 'rb') as f:
+                persisted = pickle.load(f)
+            now_epoch = time.time()
+            now_mono = time.monotonic()
+            with self._cache_lock:
+                for key, (data, epoch) in persisted.items():
+                    # Stored with wall-clock stamps; rebase onto the
+                    # monotonic clock of this process
+                    age = now_epoch - epoch
+                    if 0 <= age < self._cache_ttl:
+                        self.cache[key] = (data, now_mono - age)
+            if self.cache:
+                logger.debug("Loaded %d cached entries from disk", len(self.cache))
+        except Exception as e:
+            logger.warning("Could not load market cache from disk: %s", e)
+
+    def _save_disk_cache(self):
+        """Persist the cache atomically with wall-clock timestamps."""
+        try:
+            now_epoch = time.time()
+            now_mono = time.monotonic()
+            with self._cache_lock:
+                persisted = {
+                    key: (data, now_epoch - (now_mono - stamp))
+                    for key, (data, stamp) in self.cache.items()
+                }
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._cache_path.with_name(self._cache_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(persisted, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic swap so readers never see a half-written file
+            os.replace(tmp_path, self._cache_path)
+        except Exception as e:
+            logger.warning("Could not save market cache to disk: %s", e)
     
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """
+        Return the cached data for a key, or None if missing or stale.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached data dictionary or None
+        """
+        with self._cache_lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            data, cached_mono = entry
+            if time.monotonic() - cached_mono >= self._cache_ttl:
+                del self.cache[key]
+                return None
+            # Mark as recently used so eviction drops cold entries first
+            self.cache.move_to_end(key)
+            return data
+
+    def _cache_put(self, key: str, data: Dict, fetched_at: Optional[float] = None):
+        """
+        Store data in the cache, evicting the oldest entries past the cap.
+
+        Args:
+            key: Cache key
+            data: Data dictionary to cache
+            fetched_at: Optional monotonic timestamp (defaults to now)
+        """
+        with self._cache_lock:
+            self.cache[key] = (data, fetched_at if fetched_at is not None else time.monotonic())
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.CACHE_MAXSIZE:
+                self.cache.popitem(last=False)
+
     def fetch_index_data(self, symbol: str, name: str) -> Optional[Dict]:
         """
         Fetch data for a single index, prioritizing historical data.
@@ -31,77 +146,230 @@ class MarketDataFetcher:
         """
         try:
             # Check cache
-            cache_key = f"{symbol}_{name}"
-            if cache_key in self.cache:
-                cached_data, cached_time = self.cache[cache_key]
-                if get_ist_now() - cached_time < self.cache_expiry:
-                    logger.debug(f"Returning cached data for {name}")
-                    return cached_data
+            cached_data = self._cache_get(f"{symbol}_{name}")
+            if cached_data is not None:
+                logger.debug("Returning cached data for %s", name)
+                return cached_data
             
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             
             # PRIORITIZE historical data (better rate limits, works after market close)
-            logger.info(f"Fetching historical data for {symbol}")
+            logger.info("Fetching historical data for %s", symbol)
             hist = ticker.history(period="5d")
             
             if hist.empty:
-                logger.error(f"No historical data available for {symbol}")
+                logger.error("No historical data available for %s", symbol)
                 return None
             
-            # Get the latest close as current price (today's close if market is closed)
-            current_price = hist['Close'].iloc[-1]
-            
-            # Get previous close (from 1 trading day before)
-            if len(hist) >= 2:
-                previous_close = hist['Close'].iloc[-2]
-            else:
-                previous_close = current_price
-                logger.warning(f"Only 1 day of data for {symbol}, using same price")
-            
-            # Calculate change
-            change = current_price - previous_close
-            change_percent = calculate_change_percent(current_price, previous_close)
+            # Convert the close series to a numpy array once; the arithmetic
+            # runs in the compiled kernel (latest close = current price,
+            # previous trading day's close = reference)
+            closes = hist['Close'].to_numpy(dtype=np.float64)
+            if len(closes) < 2:
+                logger.warning("Only 1 day of data for %s, using same price", symbol)
+            current_price, previous_close, change, change_percent = change_stats(closes)
             
             # Get the timestamp of the data
             data_timestamp = hist.index[-1].to_pydatetime()
             
+            # Values stay as numpy float64 scalars; orjson serializes them
+            # directly (OPT_SERIALIZE_NUMPY) and string formatting accepts
+            # them, so there's no need to box each one into a Python float
             data = {
                 'symbol': symbol,
                 'name': name,
-                'current_price': round(float(current_price), 2),
-                'previous_close': round(float(previous_close), 2),
-                'change': round(float(change), 2),
-                'change_percent': round(float(change_percent), 2),
+                'current_price': round(current_price, 2),
+                'previous_close': round(previous_close, 2),
+                'change': round(change, 2),
+                'change_percent': round(change_percent, 2),
                 'timestamp': data_timestamp,
                 'is_real_data': True  # Flag to indicate this is real data
             }
             
-            # Update cache
-            self.cache[cache_key] = (data, get_ist_now())
+            # Update cache (write-through to disk for later processes)
+            self._cache_put(f"{symbol}_{name}", data)
+            self._save_disk_cache()
             
-            logger.info(f"✓ Fetched REAL data for {name}: {current_price} ({change_percent:+.2f}%)")
+            logger.info("✓ Fetched REAL data for %s: %s (%+.2f%%)", name, current_price, change_percent)
             return data
             
         except Exception as e:
-            logger.error(f"Error fetching data for {symbol}: {e}")
+            logger.error("Error fetching data for %s: %s", symbol, e)
             return None
     
+    def _build_batch_data(self, names: Dict[str, str], close_df: pd.DataFrame) -> Dict[str, Dict]:
+        """
+        Build index data dictionaries for a whole batch frame at once.
+
+        The change arithmetic runs as a handful of NumPy array operations
+        over all symbols together instead of per-symbol scalar math.
+
+        Args:
+            names: Mapping of symbol to display name
+            close_df: DataFrame of close prices, one column per symbol
+
+        Returns:
+            Dictionary mapping symbol to index data
+        """
+        results = {}
+        try:
+            # Forward-fill so a symbol missing the latest session still
+            # reports its last traded close
+            filled = close_df.ffill()
+            current = filled.iloc[-1].to_numpy(dtype=np.float64)
+            if len(filled.index) >= 2:
+                previous = filled.iloc[-2].to_numpy(dtype=np.float64)
+            else:
+                logger.warning("Only 1 day of data in batch, using same prices")
+                previous = current
+            change = current - previous
+            change_percent = np.where(previous != 0, change / previous * 100.0, 0.0)
+            current = np.round(current, 2)
+            previous = np.round(previous, 2)
+            change = np.round(change, 2)
+            change_percent = np.round(change_percent, 2)
+
+            fetched_at = time.monotonic()
+            for i, symbol in enumerate(filled.columns):
+                name = names.get(symbol)
+                if name is None or np.isnan(current[i]):
+                    continue
+                last_valid = close_df[symbol].last_valid_index()
+                if last_valid is None:
+                    logger.error("No historical data available for %s", symbol)
+                    continue
+
+                data = {
+                    'symbol': symbol,
+                    'name': name,
+                    'current_price': current[i],
+                    'previous_close': previous[i],
+                    'change': change[i],
+                    'change_percent': change_percent[i],
+                    'timestamp': last_valid.to_pydatetime(),
+                    'is_real_data': True
+                }
+
+                self._cache_put(f"{symbol}_{name}", data, fetched_at)
+
+                logger.info("✓ Fetched REAL data for %s: %s (%+.2f%%)", name, current[i], change_percent[i])
+                results[symbol] = data
+
+        except Exception as e:
+            logger.error("Error building batch data: %s", e)
+
+        return results
+
+    def _cache_lookup_batch(
+        self, symbol_names: List[Tuple[str, str]]
+    ) -> Tuple[Dict[str, Dict], List[Tuple[str, str]]]:
+        """
+        Split a symbol list into cache hits and misses in one pass.
+
+        Args:
+            symbol_names: List of (symbol, display_name) tuples
+
+        Returns:
+            Tuple of (hits mapping symbol to data, list of missed tuples)
+        """
+        hits = {}
+        misses = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for symbol, name in symbol_names:
+            cached_data = self._cache_get(f"{symbol}_{name}")
+            if cached_data is not None:
+                if debug_enabled:
+                    logger.debug("Returning cached data for %s", name)
+                hits[symbol] = cached_data
+            else:
+                misses.append((symbol, name))
+        return hits, misses
+
+    def fetch_batch(self, symbol_names: List[Tuple[str, str]]) -> Dict[str, Dict]:
+        """
+        Fetch several symbols with a single batched download.
+
+        One yf.download call replaces N sequential per-ticker requests, so
+        the HTTP round-trips overlap instead of serializing. When every
+        symbol is a cache hit the network (and the frame slicing) is
+        skipped entirely.
+
+        Args:
+            symbol_names: List of (symbol, display_name) tuples
+
+        Returns:
+            Dictionary mapping symbol to index data
+        """
+        results, pending = self._cache_lookup_batch(symbol_names)
+
+        if not pending:
+            return results
+
+        symbols = [symbol for symbol, _ in pending]
+        df = None
+        try:
+            logger.info("Fetching historical data for %d symbols in one batch", len(symbols))
+            df = yf.download(
+                symbols,
+                period="5d",
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                session=self.session
+            )
+        except Exception as e:
+            logger.error("Batch download failed: %s", e)
+
+        batch_results = {}
+        if df is not None and not df.empty:
+            if isinstance(df.columns, pd.MultiIndex):
+                close_df = df.xs('Close', axis=1, level=1)
+            else:
+                # Single-symbol downloads come back as a flat frame
+                close_df = df[['Close']].rename(columns={'Close': pending[0][0]})
+            batch_results = self._build_batch_data(dict(pending), close_df)
+
+        # Fall back to the per-symbol path for symbols the batch missed,
+        # fanned out across threads (yfinance releases the GIL during
+        # network I/O, so the retries overlap)
+        fallback = [item for item in pending if item[0] not in batch_results]
+        if fallback:
+            with ThreadPoolExecutor(max_workers=min(8, len(fallback))) as executor:
+                fetched = list(executor.map(
+                    lambda item: self.fetch_index_data(*item), fallback
+                ))
+            for (symbol, _), data in zip(fallback, fetched):
+                if data:
+                    batch_results[symbol] = data
+
+        for symbol, _ in pending:
+            data = batch_results.get(symbol)
+            if data:
+                results[symbol] = data
+
+        if batch_results:
+            self._save_disk_cache()
+
+        return results
+
     def fetch_multiple_indices(self, index_configs: List[Dict]) -> List[Dict]:
         """
-        Fetch data for multiple indices.
-        
+        Fetch data for multiple indices in one batched call.
+
         Args:
             index_configs: List of index configurations
-        
+
         Returns:
             List of index data dictionaries
         """
-        indices_data = []
-        
-        for config in index_configs:
-            data = self.fetch_index_data(config['symbol'], config['name'])
-            if data:
-                indices_data.append(data)
+        results = self.fetch_batch(
+            [(config['symbol'], config['name']) for config in index_configs]
+        )
+        indices_data = [
+            results[config['symbol']]
+            for config in index_configs
+            if config['symbol'] in results
+        ]
         
         # Only use demo data if we got ZERO real data
         if len(indices_data) == 0:
@@ -114,11 +382,28 @@ class MarketDataFetcher:
                     item['is_demo_data'] = True
                 return demo_data
             except Exception as e:
-                logger.error(f"Failed to load demo data: {e}")
+                logger.error("Failed to load demo data: %s", e)
                 return []
         
         return indices_data
     
+    def fetch_indices_frame(self, index_configs: List[Dict]) -> pd.DataFrame:
+        """
+        Fetch data for multiple indices as a columnar DataFrame.
+
+        One array per field instead of a dict per row: analysis code can
+        take whole columns without per-element hash lookups. Callers that
+        need the legacy row shape can call .to_dict('records') once at
+        the boundary.
+
+        Args:
+            index_configs: List of index configurations
+
+        Returns:
+            DataFrame with one row per index
+        """
+        return pd.DataFrame.from_records(self.fetch_multiple_indices(index_configs))
+
     def fetch_top_gainers_losers(self, index_symbol: str = "^NSEI", limit: int = 5) -> Dict[str, List[Dict]]:
         """
         Fetch top gainers and losers from an index.
@@ -144,45 +429,104 @@ class MarketDataFetcher:
             }
             
         except Exception as e:
-            logger.error(f"Error fetching top gainers/losers: {e}")
+            logger.error("Error fetching top gainers/losers: %s", e)
             return {'gainers': [], 'losers': []}
     
+    def fetch_bulk(self, symbols_with_meta: List[Tuple[str, str, str]]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Fetch indices and sector indices with one combined download.
+
+        Feeding the union of symbols into fetch_batch means a daily summary
+        pays for a single yf.download instead of one round of requests for
+        the indices and a second one for the sectors.
+
+        Args:
+            symbols_with_meta: List of (symbol, display_name, kind) tuples,
+                where kind is 'index' or 'sector'
+
+        Returns:
+            Tuple of (indices_data, sector_data)
+        """
+        results = self.fetch_batch(
+            [(symbol, name) for symbol, name, _ in symbols_with_meta]
+        )
+
+        indices_data = []
+        sector_data = []
+        for symbol, name, kind in symbols_with_meta:
+            data = results.get(symbol)
+            if not data:
+                continue
+            if kind == 'sector':
+                sector_data.append({
+                    'sector': name,
+                    'change_percent': data['change_percent']
+                })
+            else:
+                indices_data.append(data)
+
+        # Sort sectors by performance
+        sector_data.sort(key=lambda x: x['change_percent'], reverse=True)
+
+        # Same demo fallback as fetch_multiple_indices: only when every
+        # requested index failed
+        if not indices_data and any(kind != 'sector' for _, _, kind in symbols_with_meta):
+            logger.warning("⚠️ All real data fetches failed, using demo data as fallback")
+            try:
+                from market_monitor.demo_data import get_demo_indices
+                indices_data = get_demo_indices()
+                for item in indices_data:
+                    item['is_demo_data'] = True
+            except Exception as e:
+                logger.error("Failed to load demo data: %s", e)
+
+        return indices_data, sector_data
+
     def get_sector_performance(self) -> List[Dict]:
         """
         Get sector performance data.
-        
+
         Returns:
             List of sector performance data
         """
         try:
-            # Sector indices mapping
-            sectors = {
-                'NIFTY BANK': '^NSEBANK',
-                'NIFTY IT': '^CNXIT',
-                'NIFTY AUTO': '^CNXAUTO',
-                'NIFTY PHARMA': '^CNXPHARMA',
-                'NIFTY FMCG': '^CNXFMCG'
-            }
-            
-            sector_data = []
-            for name, symbol in sectors.items():
-                data = self.fetch_index_data(symbol, name)
-                if data:
-                    sector_data.append({
-                        'sector': name,
-                        'change_percent': data['change_percent']
-                    })
-            
-            # Sort by performance
-            sector_data.sort(key=lambda x: x['change_percent'], reverse=True)
-            
+            _, sector_data = self.fetch_bulk([
+                (symbol, name, 'sector')
+                for name, symbol in SECTOR_INDICES
+            ])
             return sector_data
-            
+
         except Exception as e:
-            logger.error(f"Error fetching sector performance: {e}")
+            logger.error("Error fetching sector performance: %s", e)
             return []
     
     def clear_cache(self):
-        """Clear the data cache."""
-        self.cache = {}
+        """Clear the data cache (in memory and on disk)."""
+        with self._cache_lock:
+            self.cache.clear()
+        try:
+            self._cache_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Could not remove disk cache: %s", e)
         logger.info("Market data cache cleared")
+
+
+# Global data fetcher instance
+_data_fetcher: Optional[MarketDataFetcher] = None
+
+
+def get_data_fetcher() -> MarketDataFetcher:
+    """
+    Get or create the shared market data fetcher instance.
+
+    One instance per process means every caller — CLI commands, scheduler
+    jobs, API handlers — reuses the same keep-alive HTTP session and the
+    same response cache instead of each opening its own.
+
+    Returns:
+        MarketDataFetcher instance
+    """
+    global _data_fetcher
+    if _data_fetcher is None:
+        _data_fetcher = MarketDataFetcher()
+    return _data_fetcher
@@ -0,0 +1,41 @@
+"""Numeric kernels for market data computations.
+
+Kept free of pandas/ORM types so they can be JIT-compiled with numba when
+it is installed (cache=True persists the compiled artifact next to the
+package, so the compile cost is paid once per install). Without numba the
+kernels run as plain NumPy, which is already fast for these sizes.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to a no-op decorator
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def change_stats(closes):
+    """
+    Compute price change statistics from a close-price series.
+
+    Args:
+        closes: float64 array of closing prices, oldest first
+
+    Returns:
+        Tuple of (current, previous, change, change_percent)
+    """
+    current = closes[-1]
+    previous = closes[-2] if closes.shape[0] >= 2 else current
+    change = current - previous
+    if previous == 0:
+        change_percent = 0.0
+    else:
+        change_percent = (change / previous) * 100.0
+    return current, previous, change, change_percent
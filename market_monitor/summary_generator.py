@@ -4,18 +4,25 @@ from typing import List, Dict, Optional
 from datetime import datetime
 from utils.logger import get_logger
 from utils.helpers import get_ist_now, format_datetime, format_percentage
-from market_monitor.data_fetcher import MarketDataFetcher
+from market_monitor.data_fetcher import get_data_fetcher, SECTOR_INDICES
 from market_monitor.analyzer import MarketAnalyzer
 
 logger = get_logger(__name__)
 
+# Static summary furniture, built once at import time
+_SEP = "=" * 60
+_SUB = "-" * 60
+_HEADER = (_SEP, "📊 DAILY MARKET SUMMARY", _SEP)
+# Longest possible sector bar; per-row bars are slices of it
+_BAR = "█" * 40
+
 
 class SummaryGenerator:
     """Generate market summaries and reports."""
     
     def __init__(self):
         """Initialize summary generator."""
-        self.data_fetcher = MarketDataFetcher()
+        self.data_fetcher = get_data_fetcher()
         self.analyzer = MarketAnalyzer()
     
     def generate_daily_summary(
@@ -36,74 +43,71 @@ class SummaryGenerator:
         try:
             current_time = get_ist_now()
             
-            # Fetch market data
+            # Fetch index and sector data in one combined download
             logger.info("Fetching market data for daily summary")
-            indices_data = self.data_fetcher.fetch_multiple_indices(indices)
-            
+            symbols_with_meta = [
+                (config['symbol'], config['name'], 'index') for config in indices
+            ]
+            if include_sectors:
+                symbols_with_meta.extend(
+                    (symbol, name, 'sector')
+                    for name, symbol in SECTOR_INDICES
+                )
+            indices_data, sector_data = self.data_fetcher.fetch_bulk(symbols_with_meta)
+
             if not indices_data:
                 return "⚠️ Unable to fetch market data at this time."
             
-            # Fetch sector data if requested
-            sector_data = []
-            if include_sectors:
-                sector_data = self.data_fetcher.get_sector_performance()
-            
             # Generate insights
             insights = self.analyzer.generate_insights(indices_data, sector_data)
             
             # Build summary
             summary_lines = [
-                "=" * 60,
-                "📊 DAILY MARKET SUMMARY",
-                "=" * 60,
+                *_HEADER,
                 f"Generated: {format_datetime(current_time, '%A, %B %d, %Y at %I:%M %p IST')}",
                 "",
                 "📈 INDEX PERFORMANCE",
-                "-" * 60
+                _SUB
             ]
             
-            # Add index data
-            for data in indices_data:
-                change_symbol = "+" if data['change'] >= 0 else ""
-                arrow = "🟢" if data['change'] >= 0 else "🔴"
-                
-                summary_lines.append(
-                    f"{arrow} {data['name']:<25} {data['current_price']:>10,.2f} "
-                    f"({change_symbol}{format_percentage(data['change_percent'])})"
-                )
+            # Add index data (formatted inline — no per-row temporaries)
+            summary_lines.extend(
+                f"{'🟢' if data['change'] >= 0 else '🔴'} {data['name']:<25} {data['current_price']:>10,.2f} "
+                f"({'+' if data['change'] >= 0 else ''}{format_percentage(data['change_percent'])})"
+                for data in indices_data
+            )
             
             summary_lines.extend([
                 "",
                 "💡 MARKET INSIGHTS",
-                "-" * 60
+                _SUB
             ])
             
             # Add insights
-            for insight in insights:
-                summary_lines.append(insight)
+            summary_lines.extend(insights)
             
             # Add sector performance if available
             if sector_data:
                 summary_lines.extend([
                     "",
                     "🏭 SECTOR PERFORMANCE",
-                    "-" * 60
+                    _SUB
                 ])
                 
-                for sector in sector_data[:5]:  # Top 5 sectors
-                    change_symbol = "+" if sector['change_percent'] >= 0 else ""
-                    bar = "█" * int(abs(sector['change_percent']) * 2)
-                    
-                    summary_lines.append(
-                        f"{sector['sector']:<20} {change_symbol}{format_percentage(sector['change_percent']):>7} {bar}"
-                    )
+                # Top 5 sectors
+                summary_lines.extend(
+                    f"{sector['sector']:<20} {'+' if sector['change_percent'] >= 0 else ''}"
+                    f"{format_percentage(sector['change_percent']):>7} "
+                    f"{_BAR[:int(abs(sector['change_percent']) * 2)]}"
+                    for sector in sector_data[:5]
+                )
             
-            summary_lines.append("=" * 60)
+            summary_lines.append(_SEP)
             
             return "\n".join(summary_lines)
             
         except Exception as e:
-            logger.error(f"Error generating daily summary: {e}")
+            logger.error("Error generating daily summary: %s", e)
             return f"⚠️ Error generating market summary: {str(e)}"
     
     def generate_live_update(self, indices: List[Dict[str, str]]) -> str:
@@ -131,24 +135,21 @@ class SummaryGenerator:
                 ""
             ]
             
-            for data in indices_data:
-                change_symbol = "+" if data['change'] >= 0 else ""
-                arrow = "🟢" if data['change'] >= 0 else "🔴"
-                
-                update_lines.append(
-                    f"{arrow} {data['name']}: {data['current_price']:,.2f} "
-                    f"({change_symbol}{format_percentage(data['change_percent'])})"
-                )
+            update_lines.extend(
+                f"{'🟢' if data['change'] >= 0 else '🔴'} {data['name']}: {data['current_price']:,.2f} "
+                f"({'+' if data['change'] >= 0 else ''}{format_percentage(data['change_percent'])})"
+                for data in indices_data
+            )
             
-            # Add sentiment
-            sentiment = self.analyzer.determine_sentiment(indices_data)
+            # Add sentiment (single analysis pass over the batch)
+            sentiment = self.analyzer.compute_once(indices_data).sentiment
             sentiment_text = {"bullish": "📈 Bullish", "bearish": "📉 Bearish", "neutral": "➡️ Neutral"}
             update_lines.append(f"\nSentiment: {sentiment_text[sentiment]}")
             
             return "\n".join(update_lines)
             
         except Exception as e:
-            logger.error(f"Error generating live update: {e}")
+            logger.error("Error generating live update: %s", e)
             return f"⚠️ Error: {str(e)}"
     
     def generate_alert_message(self, index_data: Dict, previous_data: Dict) -> Optional[str]:
@@ -185,5 +186,5 @@ class SummaryGenerator:
             return None
             
         except Exception as e:
-            logger.error(f"Error generating alert: {e}")
+            logger.error("Error generating alert: %s", e)
             return None
@@ -1,23 +1,46 @@
 """Notification manager to handle multiple notification channels."""
 
-from typing import List
-from notifications.notifier import Notifier
-from notifications.desktop_notifier import DesktopNotifier
-from notifications.email_notifier import EmailNotifier
-from notifications.telegram_notifier import TelegramNotifier
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, TYPE_CHECKING
 from utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from notifications.notifier import Notifier
+
+# Notifier backends (and what they drag in: smtplib, email.mime,
+# requests, ...) are imported lazily per enabled channel in
+# from_settings, so single-channel deployments don't pay for the rest
+
 logger = get_logger(__name__)
 
 
 class NotificationManager:
     """Manage multiple notification channels."""
+
+    # Most recently dispatched keys kept for deduplication
+    DEDUP_MAXSIZE = 1024
+
+    def __init__(self, dedup_window: float = 60.0):
+        """
+        Initialize notification manager.
+
+        Args:
+            dedup_window: Seconds within which an identical notification
+                (same title, message, and priority) is suppressed
+        """
+        self.notifiers: List["Notifier"] = []
+        # Lazily created; channels are independent I/O tasks, so they are
+        # dispatched in parallel and total latency is max() not sum()
+        self._executor = None
+        # (title, message, priority) -> monotonic dispatch time; alert
+        # storms re-fire the same payload dozens of times in seconds,
+        # and every duplicate costs real SMTP/API traffic
+        self.dedup_window = dedup_window
+        self._recent: "OrderedDict[tuple, float]" = OrderedDict()
     
-    def __init__(self):
-        """Initialize notification manager."""
-        self.notifiers: List[Notifier] = []
-    
-    def add_notifier(self, notifier: Notifier):
+    def add_notifier(self, notifier: "Notifier"):
         """
         Add a notifier to the manager.
         
@@ -49,21 +72,73 @@ class NotificationManager:
         if not self.notifiers:
             logger.warning("No notifiers configured")
             return False
+
+        # Suppress identical re-sends within the dedup window
+        key = (title, message, priority)
+        now = time.monotonic()
+        cutoff = now - self.dedup_window
+        while self._recent and next(iter(self._recent.values())) < cutoff:
+            self._recent.popitem(last=False)
+        if key in self._recent:
+            logger.debug("Suppressing duplicate notification: %s", title)
+            return True
+        self._recent[key] = now
+        if len(self._recent) > self.DEDUP_MAXSIZE:
+            self._recent.popitem(last=False)
+
+        # Filter by channel if specified; disabled notifiers would only
+        # bounce off notify()'s own guard, so skip them here
+        wanted = frozenset(c.lower() for c in channels) if channels else None
+        selected = [
+            notifier for notifier in self.notifiers
+            if notifier.enabled and (wanted is None or notifier._channel_name in wanted)
+        ]
+
+        if not selected:
+            return False
         
-        success = False
+        # A single channel needs no thread hand-off
+        if len(selected) == 1:
+            return selected[0].notify(title, message, priority)
         
-        for notifier in self.notifiers:
-            # Filter by channel if specified
-            if channels:
-                notifier_type = notifier.__class__.__name__.replace('Notifier', '').lower()
-                if notifier_type not in [c.lower() for c in channels]:
-                    continue
-            
-            if notifier.notify(title, message, priority):
-                success = True
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self.notifiers),
+                thread_name_prefix='notify'
+            )
         
-        return success
+        futures = [
+            self._executor.submit(notifier.notify, title, message, priority)
+            for notifier in selected
+        ]
+        return any(future.result() for future in futures)
     
+    def send_batch(self, messages: List[dict]) -> bool:
+        """
+        Send several notifications in one call.
+
+        The pooled SMTP/HTTP connections are reused across the whole
+        batch, so callers with many messages per tick pay connection
+        setup once instead of per message.
+
+        Args:
+            messages: Dicts with 'title' and 'message', plus optional
+                'priority' and 'channels'
+
+        Returns:
+            True if at least one message was delivered on any channel
+        """
+        delivered = False
+        for msg in messages:
+            if self.send_notification(
+                msg['title'],
+                msg['message'],
+                msg.get('priority', 'normal'),
+                msg.get('channels')
+            ):
+                delivered = True
+        return delivered
+
     @classmethod
     def from_settings(cls, settings) -> "NotificationManager":
         """
@@ -79,6 +154,7 @@ class NotificationManager:
         
         # Desktop notifications
         if settings.notifications.desktop.enabled:
+            from notifications.desktop_notifier import DesktopNotifier
             desktop = DesktopNotifier(
                 enabled=True,
                 app_name=settings.notifications.desktop.app_name
@@ -87,6 +163,7 @@ class NotificationManager:
         
         # Email notifications
         if settings.notifications.email.enabled:
+            from notifications.email_notifier import EmailNotifier
             email = EmailNotifier(
                 enabled=True,
                 smtp_server=settings.notifications.email.smtp_server,
@@ -94,12 +171,15 @@ class NotificationManager:
                 use_tls=settings.notifications.email.use_tls,
                 sender_email=settings.notifications.email.sender_email,
                 sender_password=settings.notifications.email.sender_password,
-                recipient_email=settings.notifications.email.recipient_email
+                recipient_email=settings.notifications.email.recipient_email,
+                max_msgs_per_connection=settings.notifications.email.max_msgs_per_connection,
+                html=settings.notifications.email.html
             )
             manager.add_notifier(email)
         
         # Telegram notifications
         if settings.notifications.telegram.enabled:
+            from notifications.telegram_notifier import TelegramNotifier
             telegram = TelegramNotifier(
                 enabled=True,
                 bot_token=settings.notifications.telegram.bot_token,
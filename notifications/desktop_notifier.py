@@ -1,16 +1,32 @@
 """Desktop notification implementation for Ubuntu."""
 
 import os
+import shutil
 import subprocess
-from notifications.notifier import Notifier
+import threading
+from notifications.notifier import FatalNotifierError, Notifier
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Priority -> notify-send urgency and D-Bus urgency byte, built once at
+# import time
+_URGENCY_MAP = {
+    'low': 'low',
+    'normal': 'normal',
+    'high': 'normal',
+    'critical': 'critical'
+}
+_URGENCY_BYTE = {'low': 0, 'normal': 1, 'critical': 2}
+
 
 class DesktopNotifier(Notifier):
     """Desktop notification using notify-send (Ubuntu/Linux)."""
     
+    # Resolved once per process and shared by all instances; False means
+    # the lookup ran and found nothing
+    _notify_send_path = None
+    
     def __init__(self, enabled: bool = True, app_name: str = "Market Monitor"):
         """
         Initialize desktop notifier.
@@ -21,21 +37,89 @@ class DesktopNotifier(Notifier):
         """
         super().__init__(enabled)
         self.app_name = app_name
-        self._check_availability()
+        # Persistent D-Bus connection to org.freedesktop.Notifications;
+        # None means we fork notify-send per notification instead
+        self._dbus_conn = None
+        self._dbus_lock = threading.Lock()
+        # Last fire-and-forget notify-send process, polled on the next
+        # send so finished children get reaped
+        self._last_proc = None
+        if enabled:
+            self._open_dbus()
+        if self._dbus_conn is None:
+            self._check_availability()
     
-    def _check_availability(self):
-        """Check if notify-send is available."""
+    def _open_dbus(self):
+        """
+        Open a persistent session-bus connection for notifications.
+        
+        Speaking the libnotify D-Bus protocol directly avoids the
+        fork+exec of a notify-send subprocess per notification. jeepney
+        is optional: without it (or without a session bus) we fall back
+        to the subprocess path.
+        """
+        try:
+            from jeepney import DBusAddress, new_method_call
+            from jeepney.io.blocking import open_dbus_connection
+        except ImportError:
+            logger.debug("jeepney not installed, using notify-send subprocess")
+            return
+        
         try:
-            result = subprocess.run(
-                ['which', 'notify-send'],
-                capture_output=True,
-                text=True
+            self._dbus_conn = open_dbus_connection(bus='SESSION')
+            self._dbus_address = DBusAddress(
+                '/org/freedesktop/Notifications',
+                bus_name='org.freedesktop.Notifications',
+                interface='org.freedesktop.Notifications'
             )
-            if result.returncode != 0:
+            self._new_method_call = new_method_call
+            logger.debug("Desktop notifications via D-Bus connection")
+        except Exception as e:
+            self._dbus_conn = None
+            logger.debug(f"Could not open D-Bus session: {e}")
+    
+    def _send_dbus(self, title: str, message: str, urgency: str) -> bool:
+        """
+        Send one notification over the persistent D-Bus connection.
+        
+        Args:
+            title: Notification title
+            message: Notification message
+            urgency: Urgency string (low/normal/critical)
+        
+        Returns:
+            True if sent successfully
+        """
+        urgency_byte = _URGENCY_BYTE.get(urgency, 1)
+        call = self._new_method_call(
+            self._dbus_address,
+            'Notify',
+            'susssasa{sv}i',
+            (
+                self.app_name,
+                0,
+                'dialog-information',
+                title,
+                message,
+                [],
+                {'urgency': ('y', urgency_byte)},
+                -1
+            )
+        )
+        with self._dbus_lock:
+            self._dbus_conn.send_and_get_reply(call)
+        return True
+    
+    def _check_availability(self):
+        """Check if notify-send is available (cached across instances)."""
+        cls = DesktopNotifier
+        if cls._notify_send_path is None:
+            # shutil.which is a pure-Python PATH scan — no fork+exec of
+            # a `which` subprocess at construction time
+            cls._notify_send_path = shutil.which('notify-send') or False
+            if not cls._notify_send_path:
                 logger.warning("notify-send not found. Desktop notifications may not work.")
                 logger.info("Install with: sudo apt-get install libnotify-bin")
-        except Exception as e:
-            logger.error(f"Error checking notify-send availability: {e}")
     
     def send(self, title: str, message: str, priority: str = "normal") -> bool:
         """
@@ -51,17 +135,24 @@ class DesktopNotifier(Notifier):
         """
         try:
             # Map priority to urgency
-            urgency_map = {
-                'low': 'low',
-                'normal': 'normal',
-                'high': 'normal',
-                'critical': 'critical'
-            }
-            urgency = urgency_map.get(priority, 'normal')
+            urgency = _URGENCY_MAP.get(priority, 'normal')
+            
+            if self._dbus_conn is not None:
+                try:
+                    if self._send_dbus(title, message, urgency):
+                        logger.debug(f"Desktop notification sent: {title}")
+                        return True
+                except Exception as e:
+                    # Bus went away (session restart); drop the connection
+                    # and fall back to the subprocess path
+                    logger.warning(f"D-Bus notification failed, falling back: {e}")
+                    self._dbus_conn = None
+                    self._check_availability()
             
-            # Build notify-send command
+            # Build notify-send command from the cached absolute path
+            # (skips a PATH resolution per send)
             cmd = [
-                'notify-send',
+                DesktopNotifier._notify_send_path or 'notify-send',
                 '--app-name', self.app_name,
                 '--urgency', urgency,
                 '--icon', 'dialog-information',
@@ -69,27 +160,25 @@ class DesktopNotifier(Notifier):
                 message
             ]
             
-            # Execute command
-            result = subprocess.run(
+            # Fire and forget: a desktop popup is pure UX, so there is
+            # nothing useful to do with notify-send's exit status and no
+            # reason to block the notification loop waiting for it
+            if self._last_proc is not None:
+                self._last_proc.poll()
+            self._last_proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=5
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
             )
-            
-            if result.returncode == 0:
-                logger.debug(f"Desktop notification sent: {title}")
-                return True
-            else:
-                logger.error(f"notify-send failed: {result.stderr}")
-                return False
-                
-        except FileNotFoundError:
-            logger.error("notify-send command not found. Please install libnotify-bin")
-            return False
-        except subprocess.TimeoutExpired:
-            logger.error("notify-send timed out")
-            return False
+            logger.debug(f"Desktop notification dispatched: {title}")
+            return True
+
+        except FileNotFoundError as e:
+            # Retrying won't install the binary
+            raise FatalNotifierError(
+                "notify-send command not found. Please install libnotify-bin"
+            ) from e
         except Exception as e:
             logger.error(f"Error sending desktop notification: {e}")
             return False
@@ -1,14 +1,46 @@
 """Email notification implementation."""
 
+import atexit
+import html
 import smtplib
+import threading
+from email.generator import BytesGenerator
+from email.policy import SMTP as SMTP_POLICY
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
-from notifications.notifier import Notifier
+from io import BytesIO
+from string import Template
+from typing import List, Optional, Union
+from notifications.notifier import FatalNotifierError, Notifier
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Priority -> subject prefix, built once at import time
+_PRIORITY_PREFIX = {
+    'low': '',
+    'normal': '',
+    'high': '[IMPORTANT] ',
+    'critical': '[URGENT] '
+}
+
+# HTML body template, compiled once at import time; send() only
+# substitutes the (escaped) title and message
+_HTML_TEMPLATE = Template("""
+            <html>
+                <body style="font-family: Arial, sans-serif;">
+                    <h2 style="color: #2c3e50;">$title</h2>
+                    <div style="white-space: pre-wrap; line-height: 1.6;">
+                        $message
+                    </div>
+                    <hr>
+                    <p style="color: #7f8c8d; font-size: 0.9em;">
+                        This is an automated notification from Market Monitor & Productivity System.
+                    </p>
+                </body>
+            </html>
+            """)
+
 
 class EmailNotifier(Notifier):
     """Email notification using SMTP."""
@@ -21,7 +53,9 @@ class EmailNotifier(Notifier):
         use_tls: bool = True,
         sender_email: str = "",
         sender_password: str = "",
-        recipient_email: str = ""
+        recipient_email: Union[str, List[str]] = "",
+        max_msgs_per_connection: int = 1000,
+        html: bool = True
     ):
         """
         Initialize email notifier.
@@ -33,7 +67,11 @@ class EmailNotifier(Notifier):
             use_tls: Whether to use TLS
             sender_email: Sender email address
             sender_password: Sender email password/app password
-            recipient_email: Recipient email address
+            recipient_email: Recipient address, or a list of addresses
+            max_msgs_per_connection: Messages to send before the pooled
+                connection is recycled (providers cap per-connection volume)
+            html: Send multipart plain+HTML bodies; when False a single
+                plain-text part goes out, roughly halving DATA bytes
         """
         super().__init__(enabled)
         self.smtp_server = smtp_server
@@ -41,12 +79,72 @@ class EmailNotifier(Notifier):
         self.use_tls = use_tls
         self.sender_email = sender_email
         self.sender_password = sender_password
-        self.recipient_email = recipient_email
+        # Normalize to a list once; all recipients share one SMTP
+        # transaction per message instead of one connection each
+        if isinstance(recipient_email, str):
+            self.recipients = [recipient_email] if recipient_email else []
+        else:
+            self.recipients = list(recipient_email)
+        self.recipient_email = ", ".join(self.recipients)
+        self.max_msgs_per_connection = max_msgs_per_connection
+        self.html = html
+        
+        # Pooled SMTP connection, built lazily and reused across sends
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._msgs_sent = 0
         
         # Validate configuration
-        if enabled and not all([sender_email, sender_password, recipient_email]):
+        if enabled and not all([sender_email, sender_password, self.recipients]):
             logger.warning("Email notifier enabled but missing credentials")
             self.enabled = False
+        
+        if self.enabled:
+            atexit.register(self.close)
+    
+    def _get_server(self) -> smtplib.SMTP:
+        """
+        Get the pooled SMTP connection, reconnecting if it went stale.
+        
+        Opening, negotiating TLS, and authenticating per message dominates
+        send latency during alert bursts; the session is set up once and
+        verified with a cheap NOOP before each reuse.
+        
+        Returns:
+            Authenticated SMTP connection
+        """
+        if self._smtp is not None:
+            try:
+                status, _ = self._smtp.noop()
+                if status == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_connection()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=10)
+        if self.use_tls:
+            server.starttls()
+        server.login(self.sender_email, self.sender_password)
+        self._smtp = server
+        self._msgs_sent = 0
+        logger.debug("Opened SMTP connection to %s:%s", self.smtp_server, self.smtp_port)
+        return server
+    
+    def _drop_connection(self):
+        """Close the pooled connection, ignoring errors on a dead socket."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
+    
+    def close(self):
+        """Close the pooled SMTP connection."""
+        with self._smtp_lock:
+            self._drop_connection()
     
     def send(self, title: str, message: str, priority: str = "normal") -> bool:
         """
@@ -61,58 +159,61 @@ class EmailNotifier(Notifier):
             True if sent successfully
         """
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
+            # Create message: a single plain part when HTML is off, else
+            # multipart/alternative with both renderings
+            if self.html:
+                msg = MIMEMultipart('alternative')
+                # HTML version from the precompiled template; escaping
+                # keeps markup in title/message from being interpreted
+                # as HTML
+                html_message = _HTML_TEMPLATE.substitute(
+                    title=html.escape(title),
+                    message=html.escape(message)
+                )
+                msg.attach(MIMEText(message, 'plain'))
+                msg.attach(MIMEText(html_message, 'html'))
+            else:
+                msg = MIMEText(message, 'plain')
+
             msg['From'] = self.sender_email
             msg['To'] = self.recipient_email
-            
+
             # Add priority prefix to subject
-            priority_prefix = {
-                'low': '',
-                'normal': '',
-                'high': '[IMPORTANT] ',
-                'critical': '[URGENT] '
-            }.get(priority, '')
+            msg['Subject'] = f"{_PRIORITY_PREFIX.get(priority, '')}{title}"
             
-            msg['Subject'] = f"{priority_prefix}{title}"
-            
-            # Create HTML version
-            html_message = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif;">
-                    <h2 style="color: #2c3e50;">{title}</h2>
-                    <div style="white-space: pre-wrap; line-height: 1.6;">
-                        {message}
-                    </div>
-                    <hr>
-                    <p style="color: #7f8c8d; font-size: 0.9em;">
-                        This is an automated notification from Market Monitor & Productivity System.
-                    </p>
-                </body>
-            </html>
-            """
-            
-            # Attach both plain text and HTML
-            msg.attach(MIMEText(message, 'plain'))
-            msg.attach(MIMEText(html_message, 'html'))
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=10) as server:
-                if self.use_tls:
-                    server.starttls()
-                
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            # Serialize once outside the lock; sendmail ships the
+            # pre-flattened bytes instead of re-walking the MIME tree
+            # inside send_message
+            buf = BytesIO()
+            BytesGenerator(buf, policy=SMTP_POLICY).flatten(msg)
+            data = buf.getvalue()
+
+            # Send over the pooled connection; one MAIL FROM transaction
+            # covers every recipient
+            with self._smtp_lock:
+                server = self._get_server()
+                server.sendmail(self.sender_email, self.recipients, data)
+                self._msgs_sent += 1
+                if self._msgs_sent >= self.max_msgs_per_connection:
+                    logger.debug(
+                        "Recycling SMTP connection after %d messages", self._msgs_sent
+                    )
+                    self._drop_connection()
             
             logger.info(f"Email sent to {self.recipient_email}: {title}")
             return True
             
-        except smtplib.SMTPAuthenticationError:
-            logger.error("SMTP authentication failed. Check email and password.")
-            return False
+        except smtplib.SMTPAuthenticationError as e:
+            self.close()
+            # Bad credentials won't fix themselves between retries
+            raise FatalNotifierError(
+                "SMTP authentication failed. Check email and password."
+            ) from e
         except smtplib.SMTPException as e:
             logger.error(f"SMTP error: {e}")
+            self.close()
             return False
         except Exception as e:
             logger.error(f"Error sending email: {e}")
+            self.close()
             return False
@@ -1,66 +1,103 @@
 """Base notification interface."""
 
-from abc import ABC, abstractmethod
+import random
+import time
 from typing import Optional
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Longest pause between retry attempts, in seconds
+_MAX_BACKOFF = 30
+
+
+class FatalNotifierError(Exception):
+    """Raised by send() when retrying cannot help.
+
+    Covers failures like bad credentials or a missing binary — the
+    retry loop in notify() gives up immediately instead of burning its
+    attempts on an outcome that will not change.
+    """
+    pass
+
+
+class Notifier:
+    """Base class for all notifiers.
+
+    Subclasses override send(); duck typing replaces the former ABC so
+    the retry loop can call a prebound method without going through
+    abstract-method dispatch.
+    """
 
-class Notifier(ABC):
-    """Abstract base class for all notifiers."""
-    
     def __init__(self, enabled: bool = True):
         """
         Initialize notifier.
-        
+
         Args:
             enabled: Whether this notifier is enabled
         """
         self.enabled = enabled
-    
-    @abstractmethod
+        # Cached channel name ("desktop", "email", ...) so routing in
+        # NotificationManager doesn't re-derive it per notification
+        self._channel_name = self.__class__.__name__.replace('Notifier', '').lower()
+        # Prebound send: skips per-call attribute lookup in notify()'s
+        # retry loop, which runs per attempt during batch dispatch
+        self._send_impl = self.send
+
     def send(self, title: str, message: str, priority: str = "normal") -> bool:
         """
         Send a notification.
-        
+
         Args:
             title: Notification title
             message: Notification message
             priority: Priority level (low, normal, high, critical)
-        
+
         Returns:
             True if sent successfully, False otherwise
+
+        Raises:
+            FatalNotifierError: If the failure is not retryable
         """
-        pass
-    
+        raise NotImplementedError
+
     def notify(self, title: str, message: str, priority: str = "normal", retry: int = 3) -> bool:
         """
         Send notification with retry logic.
-        
+
+        Failed attempts are spaced with exponential backoff plus jitter
+        (capped at 30s) so transient provider throttling has a chance to
+        clear between tries; a FatalNotifierError from send() stops the
+        loop at once.
+
         Args:
             title: Notification title
             message: Notification message
             priority: Priority level
             retry: Number of retries on failure
-        
+
         Returns:
             True if sent successfully, False otherwise
         """
         if not self.enabled:
-            logger.debug(f"Notifier {self.__class__.__name__} is disabled")
+            logger.debug("Notifier %s is disabled", self.__class__.__name__)
             return False
-        
+
         for attempt in range(retry):
+            if attempt:
+                time.sleep(min(2 ** attempt + random.random(), _MAX_BACKOFF))
             try:
-                success = self.send(title, message, priority)
+                success = self._send_impl(title, message, priority)
                 if success:
-                    logger.info(f"Notification sent via {self.__class__.__name__}: {title}")
+                    logger.info("Notification sent via %s: %s", self.__class__.__name__, title)
                     return True
                 else:
-                    logger.warning(f"Failed to send notification (attempt {attempt + 1}/{retry})")
+                    logger.warning("Failed to send notification (attempt %d/%d)", attempt + 1, retry)
+            except FatalNotifierError as e:
+                logger.error("Giving up on notification, not retryable: %s", e)
+                return False
             except Exception as e:
-                logger.error(f"Error sending notification (attempt {attempt + 1}/{retry}): {e}")
-        
-        logger.error(f"Failed to send notification after {retry} attempts")
+                logger.error("Error sending notification (attempt %d/%d): %s", attempt + 1, retry, e)
+
+        logger.error("Failed to send notification after %d attempts", retry)
         return False
@@ -1,6 +1,8 @@
 """Telegram notification implementation."""
 
-from typing import Optional
+import atexit
+from typing import Dict, Optional
+import requests
 from notifications.notifier import Notifier
 from utils.logger import get_logger
 
@@ -9,7 +11,13 @@ logger = get_logger(__name__)
 
 class TelegramNotifier(Notifier):
     """Telegram notification using bot API."""
-    
+
+    # One keep-alive session per bot token, shared across instances so
+    # repeated construction (tests, reloads) doesn't multiply idle
+    # connection pools
+    _sessions: Dict[str, requests.Session] = {}
+    _atexit_registered = False
+
     def __init__(
         self,
         enabled: bool = False,
@@ -18,7 +26,7 @@ class TelegramNotifier(Notifier):
     ):
         """
         Initialize Telegram notifier.
-        
+
         Args:
             enabled: Whether Telegram notifications are enabled
             bot_token: Telegram bot token
@@ -27,44 +35,61 @@ class TelegramNotifier(Notifier):
         super().__init__(enabled)
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.bot = None
-        
+        # Keep-alive session to the Bot HTTP API: one TCP+TLS setup is
+        # reused across messages instead of paid per notification
+        self.session = None
+        self._api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+
         # Validate and initialize
         if enabled and not all([bot_token, chat_id]):
             logger.warning("Telegram notifier enabled but missing credentials")
             self.enabled = False
         elif enabled:
-            self._initialize_bot()
-    
-    def _initialize_bot(self):
-        """Initialize Telegram bot."""
-        try:
-            from telegram import Bot
-            self.bot = Bot(token=self.bot_token)
-            logger.info("Telegram bot initialized")
-        except ImportError:
-            logger.warning("python-telegram-bot not installed. Install with: pip install python-telegram-bot")
-            self.enabled = False
-        except Exception as e:
-            logger.error(f"Error initializing Telegram bot: {e}")
-            self.enabled = False
-    
+            self._initialize_session()
+
+    def _initialize_session(self):
+        """Attach the per-token shared HTTP session, creating it once."""
+        cls = TelegramNotifier
+        session = cls._sessions.get(self.bot_token)
+        if session is None:
+            session = requests.Session()
+            cls._sessions[self.bot_token] = session
+            if not cls._atexit_registered:
+                atexit.register(cls._close_all)
+                cls._atexit_registered = True
+        self.session = session
+        logger.info("Telegram notifier initialized")
+
+    def close(self):
+        """Close this bot's shared HTTP session."""
+        if self.session is not None:
+            TelegramNotifier._sessions.pop(self.bot_token, None)
+            self.session.close()
+            self.session = None
+
+    @classmethod
+    def _close_all(cls):
+        """Close every pooled session at interpreter exit."""
+        while cls._sessions:
+            _, session = cls._sessions.popitem()
+            session.close()
+
     def send(self, title: str, message: str, priority: str = "normal") -> bool:
         """
         Send Telegram message.
-        
+
         Args:
             title: Message title
             message: Message content
             priority: Priority level (affects emoji prefix)
-        
+
         Returns:
             True if sent successfully
         """
-        if self.bot is None:
-            logger.error("Telegram bot not initialized")
+        if self.session is None:
+            logger.error("Telegram notifier not initialized")
             return False
-        
+
         try:
             # Add emoji based on priority
             priority_emoji = {
@@ -73,21 +98,29 @@ class TelegramNotifier(Notifier):
                 'high': '⚠️',
                 'critical': '🚨'
             }.get(priority, '📢')
-            
+
             # Format message
             formatted_message = f"{priority_emoji} <b>{title}</b>\n\n{message}"
-            
-            # Send message
-            import asyncio
-            asyncio.run(self.bot.send_message(
-                chat_id=self.chat_id,
-                text=formatted_message,
-                parse_mode='HTML'
-            ))
-            
-            logger.info(f"Telegram message sent: {title}")
-            return True
-            
+
+            # Send message over the pooled connection — a plain HTTP POST,
+            # no event loop construction per call
+            response = self.session.post(
+                self._api_url,
+                json={
+                    'chat_id': self.chat_id,
+                    'text': formatted_message,
+                    'parse_mode': 'HTML'
+                },
+                timeout=10
+            )
+
+            if response.ok and response.json().get('ok'):
+                logger.info(f"Telegram message sent: {title}")
+                return True
+
+            logger.error(f"Telegram API error: {response.text}")
+            return False
+
         except Exception as e:
             logger.error(f"Error sending Telegram message: {e}")
             return False
@@ -1,20 +1,27 @@
 """CLI interface for reminder management."""
 
 import click
-from datetime import datetime
-from tabulate import tabulate
-from colorama import Fore, Style, init
-from reminders import ReminderManager
-from utils.logger import setup_logger
-from config import get_settings
 
-# Initialize colorama
-init(autoreset=True)
+from utils.helpers import fast_iso_datetime_minute
 
-# Setup
-settings = get_settings()
-logger = setup_logger('reminders_cli', settings.app.log_file, settings.app.log_level)
-manager = ReminderManager()
+# Built lazily on first use; importing this module stays cheap so
+# `--help`, shell completion, and misspelled commands don't pay for a
+# settings parse and database open
+_manager = None
+
+
+def _get_manager():
+    """Get the shared ReminderManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        from config import get_settings
+        from reminders import ReminderManager
+        from utils.logger import setup_logger
+
+        settings = get_settings()
+        setup_logger('reminders_cli', settings.app.log_file, settings.app.log_level)
+        _manager = ReminderManager()
+    return _manager
 
 
 @click.group()
@@ -31,59 +38,58 @@ def cli():
 def add(title, datetime_str, description, recurring):
     """Add a new reminder."""
     try:
-        reminder = manager.create_reminder(title, datetime_str, description, recurring)
-        click.echo(f"{Fore.GREEN}✓ Reminder created successfully!")
-        click.echo(f"{Fore.CYAN}ID: {reminder.id}")
+        reminder = _get_manager().create_reminder(title, datetime_str, description, recurring)
+        click.secho("✓ Reminder created successfully!", fg='green')
+        click.secho(f"ID: {reminder.id}", fg='cyan')
         click.echo(f"Title: {reminder.title}")
         click.echo(f"DateTime: {reminder.datetime}")
         if recurring:
             click.echo(f"Recurring: {recurring}")
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Error creating reminder: {e}")
+        click.secho(f"✗ Error creating reminder: {e}", fg='red')
 
 
 @cli.command()
 @click.option('--all', '-a', 'show_all', is_flag=True, help='Show all reminders including inactive')
 def list(show_all):
     """List all reminders."""
-    reminders = manager.get_all_reminders(active_only=not show_all)
-    
+    from tabulate import tabulate
+
+    reminders = _get_manager().get_all_reminders(active_only=not show_all)
+
     if not reminders:
-        click.echo(f"{Fore.YELLOW}No reminders found.")
+        click.secho("No reminders found.", fg='yellow')
         return
-    
-    # Prepare table data
-    table_data = []
-    for reminder in reminders:
-        status = "✓" if reminder.is_active else "✗"
-        recurring = reminder.recurring_type or "-"
-        
-        table_data.append([
-            reminder.id,
-            status,
-            reminder.title,
-            reminder.datetime.strftime('%Y-%m-%d %H:%M'),
-            recurring,
-            reminder.description[:30] + "..." if len(reminder.description) > 30 else reminder.description
-        ])
-    
+
+    # Stream rows into tabulate instead of materializing an extra list
+    def rows():
+        for reminder in reminders:
+            yield (
+                reminder.id,
+                "✓" if reminder.is_active else "✗",
+                reminder.title,
+                fast_iso_datetime_minute(reminder.datetime),
+                reminder.recurring_type or "-",
+                reminder.description[:30] + "..." if len(reminder.description) > 30 else reminder.description
+            )
+
     # Print table
     headers = ["ID", "Active", "Title", "DateTime", "Recurring", "Description"]
-    click.echo("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
-    click.echo(f"\n{Fore.CYAN}Total: {len(reminders)} reminder(s)")
+    click.echo("\n" + tabulate(rows(), headers=headers, tablefmt="grid"))
+    click.secho(f"\nTotal: {len(reminders)} reminder(s)", fg='cyan')
 
 
 @cli.command()
 @click.argument('reminder_id', type=int)
 def show(reminder_id):
     """Show detailed information about a reminder."""
-    reminder = manager.get_reminder(reminder_id)
-    
+    reminder = _get_manager().get_reminder(reminder_id)
+
     if not reminder:
-        click.echo(f"{Fore.RED}✗ Reminder {reminder_id} not found.")
+        click.secho(f"✗ Reminder {reminder_id} not found.", fg='red')
         return
-    
-    click.echo(f"\n{Fore.CYAN}{'=' * 60}")
+
+    click.secho(f"\n{'=' * 60}", fg='cyan')
     click.echo(f"Reminder ID: {reminder.id}")
     click.echo(f"{'=' * 60}")
     click.echo(f"Title: {reminder.title}")
@@ -107,16 +113,16 @@ def update(reminder_id, title, datetime_str, description, recurring):
     """Update a reminder."""
     if recurring == 'none':
         recurring = None
-    
+
     try:
-        updated = manager.update_reminder(reminder_id, title, datetime_str, description, recurring)
-        
+        updated = _get_manager().update_reminder(reminder_id, title, datetime_str, description, recurring)
+
         if updated:
-            click.echo(f"{Fore.GREEN}✓ Reminder {reminder_id} updated successfully!")
+            click.secho(f"✓ Reminder {reminder_id} updated successfully!", fg='green')
         else:
-            click.echo(f"{Fore.RED}✗ Reminder {reminder_id} not found.")
+            click.secho(f"✗ Reminder {reminder_id} not found.", fg='red')
     except Exception as e:
-        click.echo(f"{Fore.RED}✗ Error updating reminder: {e}")
+        click.secho(f"✗ Error updating reminder: {e}", fg='red')
 
 
 @cli.command()
@@ -124,42 +130,40 @@ def update(reminder_id, title, datetime_str, description, recurring):
 @click.confirmation_option(prompt='Are you sure you want to delete this reminder?')
 def delete(reminder_id):
     """Delete a reminder."""
-    success = manager.delete_reminder(reminder_id)
-    
+    success = _get_manager().delete_reminder(reminder_id)
+
     if success:
-        click.echo(f"{Fore.GREEN}✓ Reminder {reminder_id} deleted successfully!")
+        click.secho(f"✓ Reminder {reminder_id} deleted successfully!", fg='green')
     else:
-        click.echo(f"{Fore.RED}✗ Reminder {reminder_id} not found.")
+        click.secho(f"✗ Reminder {reminder_id} not found.", fg='red')
 
 
 @cli.command()
 @click.argument('reminder_id', type=int)
 def deactivate(reminder_id):
     """Deactivate a reminder (soft delete)."""
-    success = manager.deactivate_reminder(reminder_id)
-    
+    success = _get_manager().deactivate_reminder(reminder_id)
+
     if success:
-        click.echo(f"{Fore.GREEN}✓ Reminder {reminder_id} deactivated!")
+        click.secho(f"✓ Reminder {reminder_id} deactivated!", fg='green')
     else:
-        click.echo(f"{Fore.RED}✗ Reminder {reminder_id} not found.")
+        click.secho(f"✗ Reminder {reminder_id} not found.", fg='red')
 
 
 @cli.command()
 def due():
     """Show reminders that are due now."""
-    from utils.helpers import get_ist_now
-    
-    due_reminders = manager.get_due_reminders(advance_minutes=5)
-    
+    due_reminders = _get_manager().get_due_reminders(advance_minutes=5)
+
     if not due_reminders:
-        click.echo(f"{Fore.GREEN}No reminders due right now.")
+        click.secho("No reminders due right now.", fg='green')
         return
-    
-    click.echo(f"{Fore.YELLOW}⏰ Due Reminders:\n")
-    
+
+    click.secho("⏰ Due Reminders:\n", fg='yellow')
+
     for reminder in due_reminders:
-        click.echo(f"{Fore.RED}🔔 {reminder.title}")
-        click.echo(f"   Due: {reminder.datetime.strftime('%Y-%m-%d %H:%M')}")
+        click.secho(f"🔔 {reminder.title}", fg='red')
+        click.echo(f"   Due: {fast_iso_datetime_minute(reminder.datetime)}")
         if reminder.description:
             click.echo(f"   {reminder.description}")
         click.echo()
@@ -2,6 +2,7 @@
 
 from typing import List, Optional
 from datetime import datetime, timedelta
+from sqlalchemy import DateTime, bindparam, func, or_, text
 from database.models import Reminder
 from database.db_manager import get_db_manager
 from utils.logger import get_logger
@@ -9,6 +10,13 @@ from utils.helpers import get_ist_now
 
 logger = get_logger(__name__)
 
+# Optional C parser: roughly an order of magnitude faster again than
+# fromisoformat on ISO strings; fall through to the stdlib when absent
+try:
+    from ciso8601 import parse_datetime as _fast_parse
+except ImportError:
+    _fast_parse = None
+
 
 class ReminderManager:
     """Manager for reminder operations."""
@@ -50,8 +58,7 @@ class ReminderManager:
             
             with self.db.get_session() as session:
                 session.add(reminder)
-                session.flush()
-                session.refresh(reminder)
+                session.flush()  # populates the PK; no refresh SELECT needed
                 session.expunge(reminder)  # Expunge to avoid detached instance errors
                 logger.info(f"Created reminder: {title} at {reminder_dt}")
                 return reminder
@@ -76,10 +83,60 @@ class ReminderManager:
                 query = query.filter(Reminder.is_active == True)
             reminders = query.order_by(Reminder.datetime).all()
             # Expunge all to avoid detached instance errors
-            for reminder in reminders:
-                session.expunge(reminder)
+            session.expunge_all()
             return reminders
     
+    def get_all_reminders_json(self, active_only: bool = True) -> List[str]:
+        """
+        Get pre-serialized JSON fragments for all reminders.
+
+        Reads only the cached_json column, so list responses skip ORM
+        materialization and per-row serialization entirely.
+
+        Args:
+            active_only: Whether to return only active reminders
+
+        Returns:
+            List of JSON object strings, one per reminder
+        """
+        with self.db.get_session() as session:
+            query = session.query(Reminder.id, Reminder.cached_json)
+            if active_only:
+                query = query.filter(Reminder.is_active == True)
+            rows = query.order_by(Reminder.datetime).all()
+
+            stale_ids = [rid for rid, blob in rows if blob is None]
+            if not stale_ids:
+                return [blob for _, blob in rows]
+
+            # Rows invalidated by a bulk write (or predating cached_json):
+            # re-serialize just those and write the cache back, so one
+            # invalidation doesn't degrade every later read
+            from database.models import json_encoder
+            healed = {}
+            for reminder in session.query(Reminder).filter(Reminder.id.in_(stale_ids)):
+                blob = json_encoder.encode(reminder._to_struct()).decode()
+                reminder.cached_json = blob
+                healed[reminder.id] = blob
+
+            return [blob if blob is not None else healed[rid] for rid, blob in rows]
+
+    def count_reminders(self, active_only: bool = True) -> int:
+        """
+        Count reminders without materializing rows.
+
+        Args:
+            active_only: Whether to count only active reminders
+
+        Returns:
+            Number of matching reminders
+        """
+        with self.db.get_session() as session:
+            query = session.query(func.count(Reminder.id))
+            if active_only:
+                query = query.filter(Reminder.is_active == True)
+            return query.scalar()
+
     def get_reminder(self, reminder_id: int) -> Optional[Reminder]:
         """
         Get a specific reminder by ID.
@@ -113,22 +170,38 @@ class ReminderManager:
         Returns:
             Updated Reminder or None
         """
+        # Collect provided fields and write them in one UPDATE; no ORM
+        # load or dirty-tracking needed for the write itself
+        # Bulk UPDATE bypasses the before_update hook that refreshes
+        # cached_json, so invalidate it; the JSON read path re-serializes
+        # rows whose cache is NULL
+        fields = {Reminder.cached_json: None} if any(
+            v is not None for v in (title, datetime_str, description, recurring_type)
+        ) else {}
+        if title:
+            fields[Reminder.title] = title
+        if datetime_str:
+            fields[Reminder.datetime] = self._parse_datetime(datetime_str)
+        if description is not None:
+            fields[Reminder.description] = description
+        if recurring_type is not None:
+            fields[Reminder.recurring_type] = recurring_type
+
         with self.db.get_session() as session:
+            if fields:
+                updated = session.query(Reminder).filter(
+                    Reminder.id == reminder_id
+                ).update(fields, synchronize_session=False)
+                if not updated:
+                    logger.warning(f"Reminder {reminder_id} not found")
+                    return None
+
+            # Load once for the caller (the API returns the updated row)
             reminder = session.query(Reminder).filter(Reminder.id == reminder_id).first()
             if not reminder:
                 logger.warning(f"Reminder {reminder_id} not found")
                 return None
-            
-            if title:
-                reminder.title = title
-            if datetime_str:
-                reminder.datetime = self._parse_datetime(datetime_str)
-            if description is not None:
-                reminder.description = description
-            if recurring_type is not None:
-                reminder.recurring_type = recurring_type
-            
-            session.flush()
+            session.expunge(reminder)
             logger.info(f"Updated reminder {reminder_id}")
             return reminder
     
@@ -143,13 +216,13 @@ class ReminderManager:
             True if deleted, False if not found
         """
         with self.db.get_session() as session:
-            reminder = session.query(Reminder).filter(Reminder.id == reminder_id).first()
-            if not reminder:
+            # Single DELETE; the rowcount says whether the row existed
+            deleted = session.query(Reminder).filter(
+                Reminder.id == reminder_id
+            ).delete(synchronize_session=False)
+            if not deleted:
                 logger.warning(f"Reminder {reminder_id} not found")
                 return False
-            
-            session.delete(reminder)
-            session.flush()
             logger.info(f"Deleted reminder {reminder_id}")
             return True
     
@@ -164,12 +237,16 @@ class ReminderManager:
             True if deactivated, False if not found
         """
         with self.db.get_session() as session:
-            reminder = session.query(Reminder).filter(Reminder.id == reminder_id).first()
-            if not reminder:
+            # Single UPDATE; no need to load the row first
+            updated = session.query(Reminder).filter(
+                Reminder.id == reminder_id
+            ).update(
+                # cached_json embeds is_active, so drop it for re-serialization
+                {Reminder.is_active: False, Reminder.cached_json: None},
+                synchronize_session=False
+            )
+            if not updated:
                 return False
-            
-            reminder.is_active = False
-            session.flush()
             logger.info(f"Deactivated reminder {reminder_id}")
             return True
     
@@ -185,34 +262,92 @@ class ReminderManager:
         """
         now = get_ist_now()
         check_until = now + timedelta(minutes=advance_minutes)
-        
+
         with self.db.get_session() as session:
-            reminders = session.query(Reminder).filter(
+            # The recently-notified predicate runs in SQL so the DB can
+            # use its indexes and only due rows cross the wire
+            return session.query(Reminder).filter(
                 Reminder.is_active == True,
                 Reminder.datetime <= check_until,
-                Reminder.datetime >= now - timedelta(minutes=1)  # Not already notified
+                Reminder.datetime >= now - timedelta(minutes=1),  # Not already notified
+                or_(
+                    Reminder.last_notified.is_(None),
+                    Reminder.last_notified < now - timedelta(hours=1)
+                )
             ).all()
-            
-            # Filter out recently notified reminders
-            due_reminders = []
-            for reminder in reminders:
-                if reminder.last_notified is None or \
-                   (now - reminder.last_notified) > timedelta(hours=1):
-                    due_reminders.append(reminder)
-            
-            return due_reminders
     
-    def mark_notified(self, reminder_id: int):
+    def claim_due_reminders(self, advance_minutes: int = 0, now: Optional[datetime] = None):
+        """
+        Atomically stamp and return due reminders in one statement.
+
+        A single UPDATE ... RETURNING replaces the load-iterate-update
+        dance: the due rows are marked notified and handed back in one
+        round trip, and concurrent ticks cannot claim the same reminder
+        twice. Recurring reminders still need rescheduling afterwards
+        via mark_many_notified.
+
+        Args:
+            advance_minutes: Minutes ahead to check
+            now: Timestamp to record; defaults to the current IST time
+
+        Returns:
+            List of claimed rows (id, title, description, recurring_type,
+            datetime)
+        """
+        if now is None:
+            now = get_ist_now()
+        # Stored datetimes are naive IST; strip tzinfo and type the bind
+        # parameters so the raw statement writes the same string format
+        # the ORM paths do instead of sqlite3's offset-suffixed default
+        now = now.replace(tzinfo=None)
+
+        stmt = text(
+            "UPDATE reminders "
+            "SET last_notified = :now, cached_json = NULL "
+            "WHERE is_active "
+            "AND datetime <= :until "
+            "AND datetime >= :floor "
+            "AND (last_notified IS NULL OR last_notified < :cutoff) "
+            "RETURNING id, title, description, recurring_type, datetime"
+        ).bindparams(
+            bindparam('now', type_=DateTime()),
+            bindparam('until', type_=DateTime()),
+            bindparam('floor', type_=DateTime()),
+            bindparam('cutoff', type_=DateTime())
+        ).columns(
+            Reminder.id,
+            Reminder.title,
+            Reminder.description,
+            Reminder.recurring_type,
+            Reminder.datetime
+        )
+
+        with self.db.get_session() as session:
+            return session.execute(
+                stmt,
+                {
+                    'now': now,
+                    'until': now + timedelta(minutes=advance_minutes),
+                    'floor': now - timedelta(minutes=1),  # Not already missed
+                    'cutoff': now - timedelta(hours=1)
+                }
+            ).all()
+
+    def mark_notified(self, reminder_id: int, now: Optional[datetime] = None):
         """
         Mark a reminder as notified.
-        
+
         Args:
             reminder_id: Reminder ID
+            now: Timestamp to record; defaults to the current IST time.
+                Callers processing a batch pass one value for the lot
         """
+        if now is None:
+            now = get_ist_now()
         with self.db.get_session() as session:
             reminder = session.query(Reminder).filter(Reminder.id == reminder_id).first()
             if reminder:
-                reminder.last_notified = get_ist_now()
+                reminder.last_notified = now
                 
                 # Handle recurring reminders
                 if reminder.recurring_type:
@@ -229,8 +364,73 @@ class ReminderManager:
                 
                 session.flush()
     
+    def mark_many_notified(self, reminder_ids: List[int], now: Optional[datetime] = None):
+        """
+        Mark a batch of reminders as notified in one session.
+
+        Per-reminder mark_notified calls open a session and run a
+        SELECT-then-UPDATE each — classic N+1. This issues one bulk
+        UPDATE for one-time reminders and one SELECT for the recurring
+        ones that need rescheduling.
+
+        Args:
+            reminder_ids: IDs of reminders to mark
+            now: Timestamp to record; defaults to the current IST time
+        """
+        if not reminder_ids:
+            return
+
+        if now is None:
+            now = get_ist_now()
+        with self.db.get_session() as session:
+            # One-time reminders: stamp and deactivate in a single UPDATE
+            session.query(Reminder).filter(
+                Reminder.id.in_(reminder_ids),
+                Reminder.recurring_type.is_(None)
+            ).update(
+                # cached_json embeds is_active, so drop it for re-serialization
+                {
+                    Reminder.last_notified: now,
+                    Reminder.is_active: False,
+                    Reminder.cached_json: None
+                },
+                synchronize_session=False
+            )
+
+            # Recurring reminders need their next occurrence computed
+            recurring = session.query(Reminder).filter(
+                Reminder.id.in_(reminder_ids),
+                Reminder.recurring_type.isnot(None)
+            ).all()
+            for reminder in recurring:
+                reminder.last_notified = now
+                reminder.datetime = self._calculate_next_occurrence(
+                    reminder.datetime,
+                    reminder.recurring_type
+                )
+
+            session.flush()
+            logger.info(f"Marked {len(reminder_ids)} reminders as notified")
+
     def _parse_datetime(self, datetime_str: str) -> datetime:
-        """Parse datetime string to datetime object."""
+        """Parse datetime string to datetime object.
+
+        The ISO-ish strings this app actually stores ("2026-01-15 10:00")
+        take the C fromisoformat fast path; dateutil's much slower
+        heuristic parser only runs for free-form input like
+        "tomorrow 3pm".
+        """
+        if _fast_parse is not None:
+            try:
+                return _fast_parse(datetime_str)
+            except ValueError:
+                pass
+        try:
+            return datetime.fromisoformat(
+                datetime_str.replace(' ', 'T', 1).replace('Z', '+00:00')
+            )
+        except ValueError:
+            pass
         from dateutil import parser
         try:
             return parser.parse(datetime_str)
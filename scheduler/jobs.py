@@ -1,22 +1,64 @@
 """Scheduled job definitions."""
 
+from collections import namedtuple
+from functools import lru_cache
+
 from config import get_settings
 from utils.logger import get_logger
 from utils.helpers import get_ist_now
-from market_monitor import SummaryGenerator
-from reminders import ReminderManager
-from todos import TaskManager
-from notifications import NotificationManager
-from database import get_db_manager
 
 logger = get_logger(__name__)
 
-# Global instances
-settings = get_settings()
-notification_manager = NotificationManager.from_settings(settings)
-summary_generator = SummaryGenerator()
-reminder_manager = ReminderManager()
-task_manager = TaskManager()
+# Shared helpers are built on first use rather than at import, so
+# importing this module (which the scheduler package does eagerly)
+# doesn't open database connections or parse settings
+
+
+_JobConfig = namedtuple('_JobConfig', ['indices', 'advance_minutes', 'archive_days'])
+
+
+@lru_cache(maxsize=1)
+def _job_config() -> _JobConfig:
+    """Snapshot the settings values the jobs read every tick.
+
+    Walking the pydantic attribute chains costs per access; the
+    per-tick jobs read from this flat tuple instead.
+    """
+    settings = get_settings()
+    return _JobConfig(
+        indices=settings.market.indices,
+        advance_minutes=settings.reminders.advance_notification_minutes,
+        archive_days=settings.tasks.auto_archive_completed_days
+    )
+
+
+def refresh_cache():
+    """Drop the cached settings snapshot (for config hot-reload)."""
+    _job_config.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _notification_manager():
+    from notifications import NotificationManager
+    return NotificationManager.from_settings(get_settings())
+
+
+@lru_cache(maxsize=1)
+def _summary_generator():
+    from market_monitor import SummaryGenerator
+    return SummaryGenerator()
+
+
+@lru_cache(maxsize=1)
+def _reminder_manager():
+    from reminders import ReminderManager
+    return ReminderManager()
+
+
+@lru_cache(maxsize=1)
+def _task_manager():
+    from todos import TaskManager
+    return TaskManager()
 
 
 def daily_market_summary():
@@ -28,19 +70,19 @@ def daily_market_summary():
         logger.info("Starting daily market summary job")
         
         # Generate market summary
-        market_summary = summary_generator.generate_daily_summary(
-            indices=settings.market.indices,
+        market_summary = _summary_generator().generate_daily_summary(
+            indices=_job_config().indices,
             include_sectors=True
         )
         
         # Generate task summary
-        task_summary = task_manager.generate_daily_summary()
+        task_summary = _task_manager().generate_daily_summary()
         
         # Combine summaries
         full_summary = f"{market_summary}\n{task_summary}"
         
         # Send notification
-        notification_manager.send_notification(
+        _notification_manager().send_notification(
             title="📊 Daily Market & Task Summary",
             message=full_summary,
             priority="normal"
@@ -61,12 +103,12 @@ def live_market_monitor():
         logger.info("Starting live market monitor job")
         
         # Generate live update
-        update = summary_generator.generate_live_update(
-            indices=settings.market.indices
+        update = _summary_generator().generate_live_update(
+            indices=_job_config().indices
         )
         
         # Send notification (desktop only for frequent updates)
-        notification_manager.send_notification(
+        _notification_manager().send_notification(
             title="📈 Market Update",
             message=update,
             priority="low",
@@ -85,31 +127,39 @@ def check_reminders():
     Runs every minute.
     """
     try:
-        advance_minutes = settings.reminders.advance_notification_minutes
-        due_reminders = reminder_manager.get_due_reminders(advance_minutes)
-        
+        advance_minutes = _job_config().advance_minutes
+        now = get_ist_now()
+        # One UPDATE ... RETURNING claims the due rows atomically; no
+        # separate SELECT, and overlapping ticks can't double-notify
+        due_reminders = _reminder_manager().claim_due_reminders(advance_minutes, now=now)
+
+        # Build all messages, then dispatch the batch in one manager
+        # call so pooled connections are reused across the whole tick
+        msgs = []
         for reminder in due_reminders:
             logger.info(f"Processing due reminder: {reminder.title}")
-            
-            # Format message
+
             message = f"Reminder: {reminder.title}"
             if reminder.description:
                 message += f"\n\n{reminder.description}"
-            
+
             if reminder.recurring_type:
                 message += f"\n\n🔁 Recurring: {reminder.recurring_type}"
-            
-            # Send notification
-            notification_manager.send_notification(
-                title="⏰ Reminder",
-                message=message,
-                priority="high"
-            )
-            
-            # Mark as notified
-            reminder_manager.mark_notified(reminder.id)
-        
+
+            msgs.append({
+                'title': "⏰ Reminder",
+                'message': message,
+                'priority': "high"
+            })
+
         if due_reminders:
+            _notification_manager().send_batch(msgs)
+            # Deactivate one-time reminders and reschedule recurring ones
+            # in a second batched statement, reusing the claim timestamp
+            _reminder_manager().mark_many_notified(
+                [r.id for r in due_reminders],
+                now=now
+            )
             logger.info(f"Processed {len(due_reminders)} due reminders")
             
     except Exception as e:
@@ -125,8 +175,8 @@ def cleanup_old_data():
         logger.info("Starting cleanup job")
         
         # Archive old completed tasks
-        archived_count = task_manager.archive_old_tasks(
-            days=settings.tasks.auto_archive_completed_days
+        archived_count = _task_manager().archive_old_tasks(
+            days=_job_config().archive_days
         )
         
         logger.info(f"Cleanup completed: archived {archived_count} old tasks")
@@ -138,7 +188,7 @@ def cleanup_old_data():
 def test_notification():
     """Test notification - for testing purposes."""
     try:
-        notification_manager.send_notification(
+        _notification_manager().send_notification(
             title="Test Notification",
             message="This is a test notification from the Market Monitor system.",
             priority="normal"
@@ -1,9 +1,15 @@
 """Scheduler service using APScheduler."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-import pytz
+from zoneinfo import ZoneInfo
 from config import get_settings
 from utils.logger import get_logger
 from scheduler import jobs
@@ -11,6 +17,22 @@ from scheduler import jobs
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _cron_trigger(timezone_name: str, hour, minute, day_of_week=None) -> CronTrigger:
+    """Build (and memoize) a CronTrigger for the given field spec.
+
+    Trigger parsing is pure given its arguments, so repeated
+    register/stop cycles — common in tests — reuse the same objects
+    instead of re-parsing the cron fields each time.
+    """
+    return CronTrigger(
+        day_of_week=day_of_week,
+        hour=hour,
+        minute=minute,
+        timezone=ZoneInfo(timezone_name)
+    )
+
+
 class SchedulerService:
     """Scheduler service to manage all scheduled jobs."""
     
@@ -18,12 +40,12 @@ class SchedulerService:
         """Initialize scheduler service."""
         self.settings = get_settings()
         self.scheduler = None
-        self.timezone = pytz.timezone(self.settings.scheduler.timezone)
+        self.timezone = ZoneInfo(self.settings.scheduler.timezone)
+        self._executor = None
     
-    def start(self):
-        """Start the scheduler and register all jobs."""
+    def _ensure_scheduler(self):
+        """Create the scheduler and register all jobs without starting it."""
         if self.scheduler is not None:
-            logger.warning("Scheduler already running")
             return
         
         logger.info("Initializing scheduler service")
@@ -31,6 +53,12 @@ class SchedulerService:
         # Create scheduler
         self.scheduler = BackgroundScheduler(
             timezone=self.timezone,
+            # Jobs block on HTTP and the database, so an explicit,
+            # settings-sized thread pool lets overlapping jobs run
+            # concurrently instead of queueing behind one another
+            executors={
+                'default': APSThreadPoolExecutor(self.settings.scheduler.max_workers)
+            },
             job_defaults={
                 'coalesce': self.settings.scheduler.job_defaults.coalesce,
                 'max_instances': self.settings.scheduler.job_defaults.max_instances,
@@ -40,6 +68,14 @@ class SchedulerService:
         
         # Register jobs
         self._register_jobs()
+    
+    def start(self):
+        """Start the scheduler and register all jobs."""
+        if self.scheduler is not None and self.scheduler.running:
+            logger.warning("Scheduler already running")
+            return
+        
+        self._ensure_scheduler()
         
         # Start scheduler
         self.scheduler.start()
@@ -50,12 +86,13 @@ class SchedulerService:
         
         # Daily market summary at 7:00 AM IST
         summary_time = self.settings.market.summary_time.split(':')
+        tz_name = self.settings.scheduler.timezone
         self.scheduler.add_job(
             jobs.daily_market_summary,
-            trigger=CronTrigger(
-                hour=int(summary_time[0]),
-                minute=int(summary_time[1]),
-                timezone=self.timezone
+            trigger=_cron_trigger(
+                tz_name,
+                int(summary_time[0]),
+                int(summary_time[1])
             ),
             id='daily_market_summary',
             name='Daily Market Summary',
@@ -70,11 +107,11 @@ class SchedulerService:
         
         self.scheduler.add_job(
             jobs.live_market_monitor,
-            trigger=CronTrigger(
-                day_of_week='mon-fri',
-                hour=f'{market_open[0]}-{market_close[0]}',
-                minute=f'*/{self.settings.market.monitor_interval_minutes}',
-                timezone=self.timezone
+            trigger=_cron_trigger(
+                tz_name,
+                f'{market_open[0]}-{market_close[0]}',
+                f'*/{self.settings.market.monitor_interval_minutes}',
+                day_of_week='mon-fri'
             ),
             id='live_market_monitor',
             name='Live Market Monitor',
@@ -101,11 +138,7 @@ class SchedulerService:
         # Cleanup old data daily at midnight
         self.scheduler.add_job(
             jobs.cleanup_old_data,
-            trigger=CronTrigger(
-                hour=0,
-                minute=0,
-                timezone=self.timezone
-            ),
+            trigger=_cron_trigger(tz_name, 0, 0),
             id='cleanup_old_data',
             name='Cleanup Old Data',
             replace_existing=True
@@ -118,8 +151,12 @@ class SchedulerService:
             return
         
         logger.info("Stopping scheduler service")
-        self.scheduler.shutdown(wait=True)
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=True)
         self.scheduler = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         logger.info("Scheduler service stopped")
     
     def get_jobs(self):
@@ -129,29 +166,61 @@ class SchedulerService:
         
         return self.scheduler.get_jobs()
     
-    def run_job_now(self, job_id: str):
+    def get_jobs_dry(self):
+        """
+        List registered jobs without starting the scheduler.
+        
+        Registering jobs needs no worker threads, so read-only callers
+        (the status command) can skip the start/stop cycle entirely.
+        Pending jobs have no next_run_time yet; it is computed from the
+        trigger so callers can still display it.
+        
+        Returns:
+            List of registered jobs
+        """
+        self._ensure_scheduler()
+        jobs = self.scheduler.get_jobs()
+        
+        if not self.scheduler.running:
+            now = datetime.now(self.timezone)
+            for job in jobs:
+                job.next_run_time = job.trigger.get_next_fire_time(None, now)
+        
+        return jobs
+    
+    def run_job_now(self, job_id: str) -> Optional[Future]:
         """
         Run a specific job immediately.
         
+        The job callable is submitted to an executor and the Future is
+        returned, so callers can wait for actual completion with a real
+        timeout instead of sleeping a guessed number of seconds.
+        
         Args:
             job_id: Job ID to run
+        
+        Returns:
+            Future tracking the job execution, or None if the job is unknown
         """
-        if self.scheduler is None:
-            logger.error("Scheduler not running")
-            return False
+        self._ensure_scheduler()
         
         try:
             job = self.scheduler.get_job(job_id)
-            if job:
-                job.modify(next_run_time=None)
-                logger.info(f"Triggered job: {job_id}")
-                return True
-            else:
+            if job is None:
                 logger.error(f"Job not found: {job_id}")
-                return False
+                return None
+            
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix='run_job_now'
+                )
+            
+            logger.info(f"Triggered job: {job_id}")
+            return self._executor.submit(job.func, *job.args, **job.kwargs)
         except Exception as e:
             logger.error(f"Error running job {job_id}: {e}")
-            return False
+            return None
 
 
 # Global scheduler service instance
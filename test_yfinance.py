@@ -12,24 +12,33 @@ symbols_to_test = [
     ('^NSEBANK', 'BANK NIFTY'),
 ]
 
+# One batched, threaded download for all symbols instead of a separate
+# HTTP round trip per ticker
+data = yf.download(
+    [symbol for symbol, _ in symbols_to_test],
+    period='5d',
+    group_by='ticker',
+    threads=True,
+    progress=False
+)
+
 for symbol, name in symbols_to_test:
     print(f"\n{'='*60}")
     print(f"Testing: {name} ({symbol})")
     print('='*60)
-    
+
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period='5d')
-        
-        if not hist.empty:
+        hist = data[symbol].dropna(how='all') if symbol in data else None
+
+        if hist is not None and not hist.empty:
             latest = hist.iloc[-1]
             prev = hist.iloc[-2] if len(hist) >= 2 else latest
-            
+
             price = latest['Close']
             prev_close = prev['Close']
             change = price - prev_close
             change_pct = (change / prev_close) * 100
-            
+
             print(f"✓ SUCCESS!")
             print(f"  Current: {price:.2f}")
             print(f"  Previous: {prev_close:.2f}")
@@ -38,7 +47,7 @@ for symbol, name in symbols_to_test:
             print(f"  Latest date: {hist.index[-1]}")
         else:
             print(f"✗ No data returned")
-            
+
     except Exception as e:
         print(f"✗ ERROR: {e}")
 
@@ -1,20 +1,80 @@
 """CLI interface for task/to-do management."""
 
+import re
+
 import click
 from datetime import datetime
-from tabulate import tabulate
 from colorama import Fore, Style, init
-from todos import TaskManager
-from utils.logger import setup_logger
-from config import get_settings
+from utils.helpers import fast_iso_date, fast_iso_datetime_minute
 
 # Initialize colorama
 init(autoreset=True)
 
-# Setup
-settings = get_settings()
-logger = setup_logger('tasks_cli', settings.app.log_file, settings.app.log_level)
-manager = TaskManager()
+# Built lazily on first use; importing this module stays cheap so
+# `--help`, shell completion, and misspelled commands don't pay for a
+# settings parse and database open
+_manager = None
+
+
+def _get_manager():
+    """Get the shared TaskManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        from config import get_settings
+        from todos import TaskManager
+        from utils.logger import setup_logger
+
+        settings = get_settings()
+        setup_logger('tasks_cli', settings.app.log_file, settings.app.log_level)
+        _manager = TaskManager()
+    return _manager
+
+# Priority rendering table, built once instead of per row
+PRIORITY_ICONS = {
+    'high': '🔴',
+    'medium': '🟡',
+    'low': '🔵'
+}
+
+# Overdue highlight pieces, resolved once instead of two colorama
+# attribute lookups per row
+_RED = Fore.RED
+_OVERDUE_SUFFIX = f" (OVERDUE){Style.RESET_ALL}"
+
+
+# Color escape sequences take no columns; strip them when measuring
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _render_grid(headers, rows):
+    """Render a grid table with one width pass and reused border lines.
+
+    tabulate's grid format re-scans cell widths and rebuilds border
+    strings per cell, which dominates `list` once there are a few
+    hundred tasks; here the widths, borders, and padding are computed
+    once up front.
+    """
+    def width(cell):
+        return len(_ANSI_RE.sub('', cell))
+
+    cells = [[str(c) for c in row] for row in rows]
+    widths = [
+        max(width(c) for c in col)
+        for col in zip(headers, *cells)
+    ]
+    border = '+' + '+'.join('-' * (w + 2) for w in widths) + '+'
+    header_border = '+' + '+'.join('=' * (w + 2) for w in widths) + '+'
+
+    def line(row):
+        return '|' + '|'.join(
+            f" {c}{' ' * (w - width(c))} " for c, w in zip(row, widths)
+        ) + '|'
+
+    out = [border, line(headers), header_border]
+    for row in cells:
+        out.append(line(row))
+        out.append(border)
+    return '\n'.join(out)
 
 
 @click.group()
@@ -31,7 +91,7 @@ def cli():
 def add(title, description, due, priority):
     """Add a new task."""
     try:
-        task = manager.create_task(title, description, due, priority)
+        task = _get_manager().create_task(title, description, due, priority)
         click.echo(f"{Fore.GREEN}✓ Task created successfully!")
         click.echo(f"{Fore.CYAN}ID: {task.id}")
         click.echo(f"Title: {task.title}")
@@ -47,61 +107,54 @@ def add(title, description, due, priority):
 @click.option('--priority', '-p', type=click.Choice(['low', 'medium', 'high']), help='Filter by priority')
 def list(show_all, priority):
     """List all tasks."""
-    if priority:
-        tasks = manager.get_tasks_by_priority(priority)
-    else:
-        tasks = manager.get_all_tasks(include_completed=show_all)
-    
-    if not tasks:
-        click.echo(f"{Fore.YELLOW}No tasks found.")
-        return
-    
-    # Prepare table data
+    # The overdue flag is computed in SQL alongside the fetch, so no
+    # per-row datetime comparison happens here. Rows stream from the
+    # database and are reduced to formatted strings as they arrive, so
+    # only the rendered cells are ever held, not the ORM objects
     table_data = []
-    for task in tasks:
+    for task, is_overdue in _get_manager().iter_tasks_with_overdue(
+        include_completed=show_all, priority=priority
+    ):
         # Status icon
         status = "✓" if task.is_completed else "○"
-        
-        # Priority color
-        priority_colors = {
-            'high': Fore.RED,
-            'medium': Fore.YELLOW,
-            'low': Fore.BLUE
-        }
-        priority_icon = {
-            'high': '🔴',
-            'medium': '🟡',
-            'low': '🔵'
-        }
-        
+
         # Due date formatting
-        due = task.due_date.strftime('%Y-%m-%d') if task.due_date else '-'
-        
-        # Check if overdue
-        if task.due_date and not task.is_completed:
-            from utils.helpers import get_ist_now
-            if task.due_date < get_ist_now():
-                due = f"{Fore.RED}{due} (OVERDUE){Style.RESET_ALL}"
-        
+        due = fast_iso_date(task.due_date) if task.due_date else '-'
+
+        if is_overdue:
+            due = f"{_RED}{due}{_OVERDUE_SUFFIX}"
+
+        # Truncate to 40 columns including the ellipsis; the cutoff is
+        # a literal so nothing is recomputed per row
+        desc = task.description
+        if len(desc) > 40:
+            desc = desc[:37] + "..."
+
         table_data.append([
             task.id,
             status,
-            priority_icon[task.priority],
+            PRIORITY_ICONS[task.priority],
             task.title,
             due,
-            task.description[:40] + "..." if len(task.description) > 40 else task.description
+            desc
         ])
     
-    # Print table
+    if not table_data:
+        click.echo(f"{Fore.YELLOW}No tasks found.")
+        return
+
+    # Page long listings instead of dumping everything at once
     headers = ["ID", "✓", "P", "Title", "Due Date", "Description"]
-    click.echo("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
-    click.echo(f"\n{Fore.CYAN}Total: {len(tasks)} task(s)")
+    click.echo_via_pager(
+        "\n" + _render_grid(headers, table_data)
+        + f"\n\n{Fore.CYAN}Total: {len(table_data)} task(s)\n"
+    )
 
 
 @cli.command()
 def today():
     """Show tasks due today."""
-    tasks = manager.get_today_tasks()
+    tasks = _get_manager().get_today_tasks()
     
     if not tasks:
         click.echo(f"{Fore.GREEN}No tasks due today! 🎉")
@@ -110,8 +163,7 @@ def today():
     click.echo(f"{Fore.CYAN}📅 Tasks Due Today:\n")
     
     for task in tasks:
-        priority_icon = {'high': '🔴', 'medium': '🟡', 'low': '🔵'}
-        click.echo(f"{priority_icon[task.priority]} {task.title}")
+        click.echo(f"{PRIORITY_ICONS[task.priority]} {task.title}")
         if task.description:
             click.echo(f"   {task.description}")
         click.echo()
@@ -120,7 +172,7 @@ def today():
 @cli.command()
 def overdue():
     """Show overdue tasks."""
-    tasks = manager.get_overdue_tasks()
+    tasks = _get_manager().get_overdue_tasks()
     
     if not tasks:
         click.echo(f"{Fore.GREEN}No overdue tasks! 🎉")
@@ -129,9 +181,8 @@ def overdue():
     click.echo(f"{Fore.RED}⚠️  Overdue Tasks:\n")
     
     for task in tasks:
-        priority_icon = {'high': '🔴', 'medium': '🟡', 'low': '🔵'}
-        click.echo(f"{priority_icon[task.priority]} {task.title}")
-        click.echo(f"   Due: {task.due_date.strftime('%Y-%m-%d')}")
+        click.echo(f"{PRIORITY_ICONS[task.priority]} {task.title}")
+        click.echo(f"   Due: {fast_iso_date(task.due_date)}")
         if task.description:
             click.echo(f"   {task.description}")
         click.echo()
@@ -141,7 +192,7 @@ def overdue():
 @click.argument('task_id', type=int)
 def show(task_id):
     """Show detailed information about a task."""
-    task = manager.get_task(task_id)
+    task = _get_manager().get_task(task_id)
     
     if not task:
         click.echo(f"{Fore.RED}✗ Task {task_id} not found.")
@@ -153,11 +204,11 @@ def show(task_id):
     click.echo(f"Title: {task.title}")
     click.echo(f"Description: {task.description or '(none)'}")
     click.echo(f"Priority: {task.priority}")
-    click.echo(f"Due Date: {task.due_date.strftime('%Y-%m-%d %H:%M') if task.due_date else 'Not set'}")
+    click.echo(f"Due Date: {fast_iso_datetime_minute(task.due_date) if task.due_date else 'Not set'}")
     click.echo(f"Status: {'Completed' if task.is_completed else 'Pending'}")
-    click.echo(f"Created: {task.created_at.strftime('%Y-%m-%d %H:%M')}")
+    click.echo(f"Created: {fast_iso_datetime_minute(task.created_at)}")
     if task.completed_at:
-        click.echo(f"Completed: {task.completed_at.strftime('%Y-%m-%d %H:%M')}")
+        click.echo(f"Completed: {fast_iso_datetime_minute(task.completed_at)}")
     click.echo(f"{'=' * 60}\n")
 
 
@@ -170,7 +221,7 @@ def show(task_id):
 def update(task_id, title, description, due, priority):
     """Update a task."""
     try:
-        updated = manager.update_task(task_id, title, description, due, priority)
+        updated = _get_manager().update_task(task_id, title, description, due, priority)
         
         if updated:
             click.echo(f"{Fore.GREEN}✓ Task {task_id} updated successfully!")
@@ -184,7 +235,7 @@ def update(task_id, title, description, due, priority):
 @click.argument('task_id', type=int)
 def complete(task_id):
     """Mark a task as completed."""
-    success = manager.complete_task(task_id)
+    success = _get_manager().complete_task(task_id)
     
     if success:
         click.echo(f"{Fore.GREEN}✓ Task {task_id} marked as completed! 🎉")
@@ -196,7 +247,7 @@ def complete(task_id):
 @click.argument('task_id', type=int)
 def uncomplete(task_id):
     """Mark a task as not completed."""
-    success = manager.uncomplete_task(task_id)
+    success = _get_manager().uncomplete_task(task_id)
     
     if success:
         click.echo(f"{Fore.YELLOW}Task {task_id} marked as incomplete.")
@@ -209,7 +260,7 @@ def uncomplete(task_id):
 @click.confirmation_option(prompt='Are you sure you want to delete this task?')
 def delete(task_id):
     """Delete a task."""
-    success = manager.delete_task(task_id)
+    success = _get_manager().delete_task(task_id)
     
     if success:
         click.echo(f"{Fore.GREEN}✓ Task {task_id} deleted successfully!")
@@ -220,7 +271,7 @@ def delete(task_id):
 @cli.command()
 def summary():
     """Display task summary."""
-    summary = manager.generate_daily_summary()
+    summary = _get_manager().generate_daily_summary()
     click.echo(summary)
 
 
@@ -1,14 +1,30 @@
 """Task manager for CRUD operations."""
 
-from typing import List, Optional
-from datetime import datetime, timedelta
+from functools import lru_cache
+from io import StringIO
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, time, timedelta
+from sqlalchemy import and_, func
 from database.models import Task
 from database.db_manager import get_db_manager
 from utils.logger import get_logger
-from utils.helpers import get_ist_now
+from utils.helpers import fast_iso_date, get_ist_now, parse_due
 
 logger = get_logger(__name__)
 
+# Priority emoji for summaries, built once instead of per row
+_PRIORITY_EMOJI = {"low": "🔵", "medium": "🟡", "high": "🔴"}
+
+
+def _today_range() -> Tuple[datetime, datetime]:
+    """Half-open [midnight, next midnight) bounds for today in IST.
+
+    Naive like the stored due dates, and cheaper than a chain of
+    .replace() field rewrites on an aware datetime.
+    """
+    today_start = datetime.combine(get_ist_now().date(), time.min)
+    return today_start, today_start + timedelta(days=1)
+
 
 class TaskManager:
     """Manager for task/to-do operations."""
@@ -16,6 +32,10 @@ class TaskManager:
     def __init__(self):
         """Initialize task manager."""
         self.db = get_db_manager()
+        # Per-instance cache for single-task lookups; scripted usage
+        # often re-reads the same id several times in a row. Every
+        # write path clears it so reads never see stale rows
+        self._task_cache = lru_cache(maxsize=128)(self._fetch_task)
     
     def create_task(
         self,
@@ -40,8 +60,7 @@ class TaskManager:
             # Parse due date if provided
             due_dt = None
             if due_date:
-                from dateutil import parser
-                due_dt = parser.parse(due_date)
+                due_dt = parse_due(due_date)
             
             task = Task(
                 title=title,
@@ -53,10 +72,10 @@ class TaskManager:
             
             with self.db.get_session() as session:
                 session.add(task)
-                session.flush()
-                session.refresh(task)
+                session.flush()  # populates the PK; no refresh SELECT needed
                 session.expunge(task)  # Expunge to avoid detached instance errors
-                
+
+            self._task_cache.cache_clear()
             logger.info(f"Created task: {task.title} (priority: {task.priority})")
             return task
                 
@@ -78,12 +97,109 @@ class TaskManager:
             query = session.query(Task)
             if not include_completed:
                 query = query.filter(Task.is_completed == False)
-            tasks = query.order_by(Task.due_date.asc().nullslast(), Task.priority.desc()).all()
-            # Expunge all to avoid detached instance errors
-            for task in tasks:
-                session.expunge(task)
-            return tasks
+            # expire_on_commit=False keeps the rows readable after the
+            # session closes; no expunge pass needed
+            return query.order_by(Task.due_date.asc().nullslast(), Task.priority.desc()).all()
     
+    def get_all_tasks_json(self, include_completed: bool = False) -> List[str]:
+        """
+        Get pre-serialized JSON fragments for all tasks.
+
+        Reads only the cached_json column, so list responses skip ORM
+        materialization and per-row serialization entirely.
+
+        Args:
+            include_completed: Whether to include completed tasks
+
+        Returns:
+            List of JSON object strings, one per task
+        """
+        with self.db.get_session() as session:
+            query = session.query(Task.id, Task.cached_json)
+            if not include_completed:
+                query = query.filter(Task.is_completed == False)
+            rows = query.order_by(Task.due_date.asc().nullslast(), Task.priority.desc()).all()
+
+            stale_ids = [tid for tid, blob in rows if blob is None]
+            if not stale_ids:
+                return [blob for _, blob in rows]
+
+            # Rows invalidated by a bulk write (or predating cached_json):
+            # re-serialize just those and write the cache back, so one
+            # invalidation doesn't degrade every later read
+            from database.models import json_encoder
+            healed = {}
+            for task in session.query(Task).filter(Task.id.in_(stale_ids)):
+                blob = json_encoder.encode(task._to_struct()).decode()
+                task.cached_json = blob
+                healed[task.id] = blob
+
+            return [blob if blob is not None else healed[tid] for tid, blob in rows]
+
+    def get_tasks_with_overdue(
+        self,
+        include_completed: bool = False,
+        priority: Optional[str] = None
+    ) -> List[tuple]:
+        """
+        Get task rows with their overdue status annotated by the database.
+
+        The overdue check runs as an indexed SQL predicate instead of a
+        per-row Python datetime comparison, so listing stays cheap as
+        the table grows.
+
+        Args:
+            include_completed: Whether to include completed tasks
+            priority: Optional priority level to filter by
+
+        Returns:
+            List of (row, is_overdue) tuples (see iter_tasks_with_overdue)
+        """
+        return list(self.iter_tasks_with_overdue(include_completed, priority))
+
+    def iter_tasks_with_overdue(
+        self,
+        include_completed: bool = False,
+        priority: Optional[str] = None
+    ):
+        """
+        Stream (row, is_overdue) tuples in listing order.
+
+        Only the columns the listing renders are selected, so each row
+        comes back as a lightweight named tuple — no ORM instance
+        construction, no identity-map entry — fetched in server-side
+        batches via yield_per.
+
+        Args:
+            include_completed: Whether to include completed tasks
+            priority: Optional priority level to filter by
+
+        Yields:
+            (row, is_overdue) tuples; rows expose id, is_completed,
+            priority, title, due_date and description attributes
+        """
+        # Stored due dates are naive IST, so compare against naive wall time
+        now = get_ist_now().replace(tzinfo=None)
+
+        with self.db.get_session() as session:
+            query = session.query(
+                Task.id,
+                Task.is_completed,
+                Task.priority,
+                Task.title,
+                Task.due_date,
+                Task.description,
+                and_(Task.due_date < now, Task.is_completed == False).label('is_overdue')
+            )
+            if not include_completed:
+                query = query.filter(Task.is_completed == False)
+            if priority:
+                query = query.filter(Task.priority == priority)
+            query = query.order_by(Task.due_date.asc().nullslast(), Task.priority.desc())
+            for row in query.yield_per(200):
+                # NULL due dates come back as SQL NULL; normalize to bool
+                yield row, bool(row.is_overdue)
+
     def get_task(self, task_id: int) -> Optional[Task]:
         """
         Get a specific task by ID.
@@ -94,6 +210,10 @@ class TaskManager:
         Returns:
             Task object or None
         """
+        return self._task_cache(task_id)
+
+    def _fetch_task(self, task_id: int) -> Optional[Task]:
+        """Uncached single-task lookup backing the per-id cache."""
         return self.db.get_by_id(Task, task_id)
     
     def get_tasks_by_priority(self, priority: str) -> List[Task]:
@@ -119,14 +239,12 @@ class TaskManager:
         Returns:
             List of Task objects
         """
-        now = get_ist_now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
+        today_start, today_end = _today_range()
+
         with self.db.get_session() as session:
             return session.query(Task).filter(
                 Task.due_date >= today_start,
-                Task.due_date <= today_end,
+                Task.due_date < today_end,
                 Task.is_completed == False
             ).all()
     
@@ -137,14 +255,48 @@ class TaskManager:
         Returns:
             List of Task objects
         """
-        now = get_ist_now()
-        
+        now = get_ist_now().replace(tzinfo=None)
+
         with self.db.get_session() as session:
             return session.query(Task).filter(
                 Task.due_date < now,
                 Task.is_completed == False
             ).all()
     
+    def get_task_stats(self) -> Dict[str, int]:
+        """
+        Get pending task counts in a single aggregation query.
+
+        Returns:
+            Dictionary with 'total', 'today', 'overdue' and 'high_priority' counts
+        """
+        now = get_ist_now().replace(tzinfo=None)
+
+        with self.db.get_session() as session:
+            return self._pending_stats(session, now)
+
+    @staticmethod
+    def _pending_stats(session, now: datetime) -> Dict[str, int]:
+        """Run the pending-task aggregation query on an existing session."""
+        today_start, today_end = _today_range()
+
+        total, today, overdue, high_priority = session.query(
+            func.count(Task.id),
+            func.count(Task.id).filter(
+                Task.due_date >= today_start,
+                Task.due_date < today_end
+            ),
+            func.count(Task.id).filter(Task.due_date < now),
+            func.count(Task.id).filter(Task.priority == 'high')
+        ).filter(Task.is_completed == False).one()
+
+        return {
+            'total': total,
+            'today': today,
+            'overdue': overdue,
+            'high_priority': high_priority
+        }
+
     def update_task(
         self,
         task_id: int,
@@ -177,12 +329,12 @@ class TaskManager:
             if description is not None:
                 task.description = description
             if due_date:
-                from dateutil import parser
-                task.due_date = parser.parse(due_date)
+                task.due_date = parse_due(due_date)
             if priority:
                 task.priority = priority
             
             session.flush()
+            self._task_cache.cache_clear()
             logger.info(f"Updated task {task_id}")
             return task
     
@@ -204,6 +356,7 @@ class TaskManager:
             task.is_completed = True
             task.completed_at = get_ist_now()
             session.flush()
+            self._task_cache.cache_clear()
             logger.info(f"Completed task {task_id}: {task.title}")
             return True
     
@@ -225,6 +378,7 @@ class TaskManager:
             task.is_completed = False
             task.completed_at = None
             session.flush()
+            self._task_cache.cache_clear()
             logger.info(f"Uncompleted task {task_id}")
             return True
     
@@ -245,6 +399,7 @@ class TaskManager:
             
             session.delete(task)
             session.flush()
+            self._task_cache.cache_clear()
             logger.info(f"Deleted task {task_id}")
             return True
     
@@ -261,16 +416,14 @@ class TaskManager:
         cutoff_date = get_ist_now() - timedelta(days=days)
         
         with self.db.get_session() as session:
-            old_tasks = session.query(Task).filter(
+            # One bulk DELETE instead of hydrating every row and
+            # emitting a statement per task
+            count = session.query(Task).filter(
                 Task.is_completed == True,
                 Task.completed_at < cutoff_date
-            ).all()
-            
-            count = len(old_tasks)
-            for task in old_tasks:
-                session.delete(task)
-            
-            session.flush()
+            ).delete(synchronize_session=False)
+
+            self._task_cache.cache_clear()
             logger.info(f"Archived {count} old tasks")
             return count
     
@@ -281,32 +434,46 @@ class TaskManager:
         Returns:
             Formatted summary string
         """
-        today_tasks = self.get_today_tasks()
-        overdue_tasks = self.get_overdue_tasks()
-        all_tasks = self.get_all_tasks()
-        
-        lines = [
-            "",
-            "📋 TASK SUMMARY",
-            "-" * 60
-        ]
-        
-        if overdue_tasks:
-            lines.append(f"⚠️  Overdue Tasks: {len(overdue_tasks)}")
-            for task in overdue_tasks[:3]:  # Show max 3
-                lines.append(f"   • {task.title} (Due: {task.due_date.strftime('%Y-%m-%d')})")
-        
-        if today_tasks:
-            lines.append(f"📅 Today's Tasks: {len(today_tasks)}")
-            for task in today_tasks:
-                priority_emoji = {"low": "🔵", "medium": "🟡", "high": "🔴"}.get(task.priority, "⚪")
-                lines.append(f"   {priority_emoji} {task.title}")
-        else:
-            lines.append("📅 No tasks due today")
-        
+        # All counts come from one aggregation query; only the tasks
+        # actually rendered are fetched, with LIMIT pushed into SQL.
+        # Everything runs on a single session so the summary pays one
+        # connection checkout instead of one per helper
+        now = get_ist_now().replace(tzinfo=None)
+        today_start, today_end = _today_range()
+
+        # Lines are written straight into one buffer rather than
+        # accumulated in a list and joined at the end
+        buf = StringIO()
+        buf.write("\n📋 TASK SUMMARY\n")
+        buf.write("-" * 60)
+
+        with self.db.get_session() as session:
+            stats = self._pending_stats(session, now)
+
+            if stats['overdue']:
+                buf.write(f"\n⚠️  Overdue Tasks: {stats['overdue']}")
+                shown = session.query(Task).filter(
+                    Task.due_date < now,
+                    Task.is_completed == False
+                ).order_by(Task.due_date.asc()).limit(3).all()
+                for task in shown:
+                    buf.write(f"\n   • {task.title} (Due: {fast_iso_date(task.due_date)})")
+
+            if stats['today']:
+                buf.write(f"\n📅 Today's Tasks: {stats['today']}")
+                today_tasks = session.query(Task).filter(
+                    Task.due_date >= today_start,
+                    Task.due_date < today_end,
+                    Task.is_completed == False
+                ).all()
+                for task in today_tasks:
+                    priority_emoji = _PRIORITY_EMOJI.get(task.priority, "⚪")
+                    buf.write(f"\n   {priority_emoji} {task.title}")
+            else:
+                buf.write("\n📅 No tasks due today")
+
         # Priority breakdown
-        high_priority = len([t for t in all_tasks if t.priority == "high"])
-        if high_priority > 0:
-            lines.append(f"🔴 High Priority Tasks: {high_priority}")
-        
-        return "\n".join(lines)
+        if stats['high_priority'] > 0:
+            buf.write(f"\n🔴 High Priority Tasks: {stats['high_priority']}")
+
+        return buf.getvalue()
@@ -1,30 +1,37 @@
 """Utility helper functions."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
-import pytz
+from zoneinfo import ZoneInfo
+
+# Shared IST zone object; zoneinfo is C-backed and has no
+# localize/normalize footguns
+IST = ZoneInfo('Asia/Kolkata')
+
+# NSE trading hours as plain times; comparing time-of-day directly
+# avoids building two datetime objects per is_market_open call
+_MARKET_OPEN = time(9, 15)
+_MARKET_CLOSE = time(15, 30)
 
 
 def get_ist_now() -> datetime:
     """Get current datetime in IST timezone."""
-    ist = pytz.timezone('Asia/Kolkata')
-    return datetime.now(ist)
+    return datetime.now(IST)
 
 
 def utc_to_ist(dt: datetime) -> datetime:
     """Convert UTC datetime to IST."""
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
-    ist = pytz.timezone('Asia/Kolkata')
-    return dt.astimezone(ist)
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(IST)
 
 
 def ist_to_utc(dt: datetime) -> datetime:
     """Convert IST datetime to UTC."""
-    ist = pytz.timezone('Asia/Kolkata')
     if dt.tzinfo is None:
-        dt = ist.localize(dt)
-    return dt.astimezone(pytz.utc)
+        dt = dt.replace(tzinfo=IST)
+    return dt.astimezone(timezone.utc)
 
 
 def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
@@ -37,13 +44,54 @@ def parse_datetime(dt_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> dateti
     return datetime.strptime(dt_str, format_str)
 
 
+# dateutil is imported at most once per process, and only when a
+# non-ISO due date is actually seen
+_dateutil_parser = None
+
+
+def parse_due(s: str) -> datetime:
+    """Parse a due-date string, fast-pathing ISO-style input.
+
+    CLI input is almost always "YYYY-MM-DD" or "YYYY-MM-DD HH:MM",
+    which the C-level fromisoformat handles directly; dateutil's
+    permissive (and slow) grammar is only imported and consulted when
+    that fails.
+    """
+    global _dateutil_parser
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        if _dateutil_parser is None:
+            from dateutil import parser as _dateutil_parser
+        return _dateutil_parser.parse(s)
+
+
+def fast_iso_date(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD.
+
+    Equivalent to strftime('%Y-%m-%d') but skips the C locale
+    machinery; noticeably cheaper when called per row in listings.
+    """
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def fast_iso_datetime_minute(dt: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM (see fast_iso_date)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
 def format_currency(amount: float, currency: str = "₹") -> str:
     """Format currency amount."""
     return f"{currency}{amount:,.2f}"
 
 
+@lru_cache(maxsize=256)
 def format_percentage(value: float, decimals: int = 2) -> str:
-    """Format percentage value."""
+    """Format percentage value.
+
+    Pure function of its inputs, so repeats (the same index formatted in
+    the summary, insights, and sector lines) are served from the cache.
+    """
     return f"{value:.{decimals}f}%"
 
 
@@ -64,12 +112,9 @@ def is_market_open(current_time: Optional[datetime] = None) -> bool:
     # Check if it's a weekday (0 = Monday, 6 = Sunday)
     if current_time.weekday() >= 5:  # Saturday or Sunday
         return False
-    
-    # Check time
-    market_open = current_time.replace(hour=9, minute=15, second=0, microsecond=0)
-    market_close = current_time.replace(hour=15, minute=30, second=0, microsecond=0)
-    
-    return market_open <= current_time <= market_close
+
+    # Check time-of-day only; no datetime construction
+    return _MARKET_OPEN <= current_time.time() <= _MARKET_CLOSE
 
 
 def calculate_change_percent(current: float, previous: float) -> float:
@@ -86,15 +131,20 @@ def truncate_string(text: str, max_length: int = 50, suffix: str = "...") -> str
     return text[:max_length - len(suffix)] + suffix
 
 
+@lru_cache(maxsize=366)
+def _next_weekday_offset(weekday: int) -> int:
+    """Days until the next weekday, given the current day of week."""
+    offset = 1
+    while (weekday + offset) % 7 >= 5:
+        offset += 1
+    return offset
+
+
 def get_next_weekday(current_date: Optional[datetime] = None) -> datetime:
     """Get next weekday (skip weekends)."""
     if current_date is None:
         current_date = get_ist_now()
-    
-    next_day = current_date + timedelta(days=1)
-    
-    # Skip weekends
-    while next_day.weekday() >= 5:
-        next_day += timedelta(days=1)
-    
-    return next_day
+
+    # The skip distance only depends on the day of week, so the loop
+    # runs at most once per weekday value and is a lookup afterwards
+    return current_date + timedelta(days=_next_weekday_offset(current_date.weekday()))
@@ -1,11 +1,25 @@
 """Logging configuration and utilities."""
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Listeners draining log queues to disk; stopped at interpreter exit so
+# buffered records are flushed
+_queue_listeners = []
+
+
+def _stop_queue_listeners():
+    for listener in _queue_listeners:
+        listener.stop()
+
+
+atexit.register(_stop_queue_listeners)
+
 
 def setup_logger(
     name: str,
@@ -64,7 +78,16 @@ def setup_logger(
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+
+        # Don't block callers on disk I/O: records go to an in-memory queue
+        # and a background listener thread does the actual file writes
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        _queue_listeners.append(listener)
+        logger.addHandler(queue_handler)
     
     return logger
 